@@ -43,6 +43,23 @@ ALL_VOID_TERMS = set()
 for category in VOID_CLUSTER.values():
     ALL_VOID_TERMS.update(category)
 
+# Term -> tier, so classification is one dict probe per token. Earlier tiers win
+# for terms listed in more than one (filled in reverse, so they overwrite).
+VOID_TIER = {
+    term: tier
+    for tier, terms in reversed(VOID_CLUSTER.items())
+    for term in terms
+}
+
+# Every void term as one alternation, anchored to token boundaries, so hits can
+# be pulled out of raw text in a single left-to-right scan without tokenizing.
+# Longest terms first so "shadows" wins over "shadow" at the same position.
+VOID_TERM_RE = re.compile(
+    r"(?<![a-z'])(?:"
+    + "|".join(re.escape(t) for t in sorted(ALL_VOID_TERMS, key=lambda t: (-len(t), t)))
+    + r")(?![a-z'])"
+)
+
 # Genre baselines (proportion of void-cluster words in total)
 BASELINES = {
     "general_rock": 0.02,
@@ -53,25 +70,45 @@ BASELINES = {
     "dark_ambient": 0.10,
 }
 
+# Word pattern shared with sibling scripts so they skip the re-module cache lookup.
+# Only runs of 2+ characters match (single chars are noise), so the scan itself
+# drops them instead of a filter pass over every word.
+TOKEN_RE = re.compile(r"[a-z']{2,}")
+# Bytes twin of TOKEN_RE for undecoded file contents. Matches both cases so the
+# input never needs a full lower() copy; UTF-8 multibyte sequences contain no
+# ASCII bytes, so tokens split where they would on the decoded text — except
+# around the only two code points whose lower() yields ASCII letters, U+0130
+# (İ -> i + combining dot) and U+212A (Kelvin sign -> k). Input containing
+# either is decoded and goes through tokenize() instead.
+TOKEN_BYTES_RE = re.compile(rb"[A-Za-z']{2,}")
+_ASCII_FOLDING_UTF8 = (b"\xc4\xb0", b"\xe2\x84\xaa")  # U+0130, U+212A
+
 
 def tokenize(text: str) -> list[str]:
-    """Simple word tokenizer — lowercase, strip punctuation."""
-    words = re.findall(r"[a-z']+", text.lower())
-    return [w for w in words if len(w) > 1]  # Skip single chars
+    """Simple word tokenizer — lowercase, strip punctuation, skip single chars."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def find_void_terms(text: str) -> list[str]:
+    """Void-cluster tokens of text, in order — same as filtering tokenize()."""
+    return VOID_TERM_RE.findall(text.lower())
+
+
+def tokenize_bytes(data: bytes) -> list[str]:
+    """tokenize() for raw UTF-8 bytes, including an mmap; same tokens as
+    tokenize(data.decode())."""
+    # find(), not `in`: on an mmap `in` tests for a single byte value
+    if any(data.find(seq) != -1 for seq in _ASCII_FOLDING_UTF8):
+        return tokenize(str(data, "utf-8"))
+    return [w.lower().decode("ascii") for w in TOKEN_BYTES_RE.findall(data)]
 
 
 def classify_void_tokens(tokens: list[str]) -> dict:
     """Classify tokens into void cluster categories."""
     result = {"direct": [], "synonyms": [], "semantic_neighbors": [], "non_void": []}
+    tier_of = VOID_TIER.get
     for token in tokens:
-        if token in VOID_CLUSTER["direct"]:
-            result["direct"].append(token)
-        elif token in VOID_CLUSTER["synonyms"]:
-            result["synonyms"].append(token)
-        elif token in VOID_CLUSTER["semantic_neighbors"]:
-            result["semantic_neighbors"].append(token)
-        else:
-            result["non_void"].append(token)
+        result[tier_of(token, "non_void")].append(token)
     return result
 
 
@@ -110,10 +147,19 @@ def cohens_h(p1: float, p2: float) -> float:
 
 def analyze(text: str, baselines: dict = None) -> dict:
     """Full void cluster analysis on text."""
+    return analyze_tokens(tokenize(text), baselines)
+
+
+def analyze_bytes(data: bytes, baselines: dict = None) -> dict:
+    """Full void cluster analysis on undecoded file contents."""
+    return analyze_tokens(tokenize_bytes(data), baselines)
+
+
+def analyze_tokens(tokens: list[str], baselines: dict = None) -> dict:
+    """Full void cluster analysis on an already-tokenized text."""
     if baselines is None:
         baselines = BASELINES
 
-    tokens = tokenize(text)
     total = len(tokens)
     freq = Counter(tokens)
     classified = classify_void_tokens(tokens)
@@ -104,14 +104,24 @@ CREATIVE_LANGUAGE = {
 }
 
 
+# Tokenizer patterns, compiled once (same as tokenize_conversations.py)
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_RE = re.compile(r"`[^`]+`")
+_URL_RE = re.compile(r"https?://\S+")
+_WORD_RE = re.compile(r"\b[a-z][a-z'-]*[a-z]\b|[a-z]\b")
+
+
 def tokenize(text: str) -> list[str]:
     """Tokenize text into lowercase words."""
     text = text.lower()
-    text = re.sub(r"```[\s\S]*?```", " ", text)  # Remove code blocks
-    text = re.sub(r"`[^`]+`", " ", text)  # Remove inline code
-    text = re.sub(r"https?://\S+", " ", text)  # Remove URLs
-    words = re.findall(r"\b[a-z][a-z'-]*[a-z]\b|[a-z]\b", text)
-    return [w for w in words if len(w) > 1]
+    # Each strip pass only runs when its delimiter occurs in the text
+    if "`" in text:
+        if "```" in text:
+            text = _CODE_BLOCK_RE.sub(" ", text)  # Remove code blocks
+        text = _INLINE_RE.sub(" ", text)  # Remove inline code
+    if "://" in text:
+        text = _URL_RE.sub(" ", text)  # Remove URLs
+    return [w for w in _WORD_RE.findall(text) if len(w) > 1]
 
 
 def extract_features(conv_data: dict) -> dict:
@@ -20,99 +20,236 @@ Usage:
 import argparse
 import json
 import math
+import mmap
+import os
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain, repeat
+from multiprocessing import shared_memory
 from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import numpy as np
 
 # Import the analyzer from sibling module
 sys.path.insert(0, str(Path(__file__).parent))
-from analyze import analyze, tokenize, ALL_VOID_TERMS  # noqa: E402
+from analyze import analyze_bytes, find_void_terms, tokenize, ALL_VOID_TERMS  # noqa: E402
+
+TOP_VOID_TERMS = 10
+
+# One row per conversation file, filled in place by analyze_conversation_texts
+TEXT_RESULT_DTYPE = np.dtype([
+    ("void_percent", np.float64),
+    ("void_total", np.int64),
+    ("total_tokens", np.int64),
+    ("top_terms", "U32", (TOP_VOID_TERMS,)),
+    ("top_counts", np.int64, (TOP_VOID_TERMS,)),
+])
+
+
+class ConversationIndex(NamedTuple):
+    """The index fields this script reads, stored column-wise.
+
+    Row i of the conversation index is (slugs[i], titles[i], dates[i]);
+    months[i] is its YYYY-MM key, or "" when the conversation is undated.
+    """
+    slugs: np.ndarray
+    titles: np.ndarray
+    dates: np.ndarray
+    months: np.ndarray
+
+    def take(self, rows: np.ndarray) -> "ConversationIndex":
+        """Select (and reorder) rows across every column."""
+        return ConversationIndex(*(column[rows] for column in self))
 
 
 def load_index(index_path: Path) -> dict:
-    """Load the conversation index JSON."""
-    return json.loads(index_path.read_text(encoding="utf-8"))
+    """Load the conversation index JSON, converting entries to a ConversationIndex."""
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    conversations = index.get("conversations", [])
+    dates = [conv.get("date_iso") or "" for conv in conversations]
+    index["conversations"] = ConversationIndex(
+        slugs=np.array([conv.get("slug", "") for conv in conversations], dtype=object),
+        titles=np.array([conv.get("title", "") for conv in conversations], dtype=object),
+        dates=np.array(dates, dtype=object),
+        months=np.array([d[:7] for d in dates], dtype="U7"),
+    )
+    return index
+
 
+def group_by_month(conversations: ConversationIndex) -> dict[str, np.ndarray]:
+    """Group conversation rows by YYYY-MM.
 
-def group_by_month(conversations: list[dict]) -> dict[str, list[dict]]:
-    """Group conversations by YYYY-MM."""
-    monthly = defaultdict(list)
-    for conv in conversations:
-        date_iso = conv.get("date_iso")
-        if date_iso:
-            month_key = date_iso[:7]  # YYYY-MM
-            monthly[month_key].append(conv)
-    return dict(sorted(monthly.items()))
+    Returns month -> row indices, months in chronological order. Rows keep
+    their order within each month.
+    """
+    dated = np.flatnonzero(conversations.months != "")
+    months, inverse = np.unique(conversations.months[dated], return_inverse=True)
+    return {str(month): dated[inverse == i] for i, month in enumerate(months)}
 
 
-def analyze_title_void_density(conversations: list[dict]) -> dict:
-    """Compute void-cluster density across conversation titles."""
-    all_title_tokens = []
-    void_hits = []
+def analyze_title_void_density(titles: np.ndarray) -> dict:
+    """Compute void-cluster density across conversation titles.
 
-    for conv in conversations:
-        title = conv.get("title", "")
-        tokens = tokenize(title)
-        all_title_tokens.extend(tokens)
-        hits = [t for t in tokens if t in ALL_VOID_TERMS]
-        if hits:
-            void_hits.append({
-                "title": title,
-                "date": conv.get("date_iso", "unknown"),
-                "hits": hits,
-            })
+    Counts only; collect_void_titles() lists the titles that had hits.
+    """
+    total = 0
+    void_count = 0
 
-    total = len(all_title_tokens)
-    void_count = sum(len(h["hits"]) for h in void_hits)
+    for title in titles:
+        tokens = tokenize(title)
+        total += len(tokens)
+        void_count += sum(1 for t in tokens if t in ALL_VOID_TERMS)
 
     return {
         "total_tokens": total,
         "void_count": void_count,
         "void_proportion": round(void_count / total, 6) if total > 0 else 0,
-        "void_titles": void_hits,
     }
 
 
-def analyze_conversation_texts(conversations_dir: Path) -> dict[str, dict]:
-    """Analyze full conversation text files, keyed by slug."""
+def collect_void_titles(titles: np.ndarray, dates: np.ndarray) -> list[dict]:
+    """List the titles containing void-cluster terms, with their hits."""
+    void_titles = []
+    for title, date in zip(titles, dates):
+        hits = find_void_terms(title)
+        if hits:
+            void_titles.append({
+                "title": title,
+                "date": date or "unknown",
+                "hits": hits,
+            })
+    return void_titles
+
+
+def _analyze_file_mapped(md_file: Path) -> dict:
+    """Run analyze_bytes over a memory-mapped file rather than a read() copy."""
+    with open(md_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return analyze_bytes(b"")  # mmap refuses zero-length files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return analyze_bytes(mm)
+
+
+def _fill_text_row(out: np.ndarray, row: int, md_file: Path) -> None:
+    """Analyze one conversation file into row `row` of a TEXT_RESULT_DTYPE array."""
+    result = _analyze_file_mapped(md_file)
+    out["void_percent"][row] = result["void_cluster"]["percent"]
+    out["void_total"][row] = result["void_cluster"]["total"]
+    out["total_tokens"][row] = result["total_tokens"]
+    top = list(result["void_term_frequencies"].items())[:TOP_VOID_TERMS]
+    for j, (term, count) in enumerate(top):
+        out["top_terms"][row, j] = term
+        out["top_counts"][row, j] = count
+
+
+def _text_row_worker(shm_name: str, n_files: int, row: int, md_file: Path) -> None:
+    """Process-pool entry point: attach to the shared result block and fill one row."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((n_files,), dtype=TEXT_RESULT_DTYPE, buffer=shm.buf)
+        _fill_text_row(out, row, md_file)
+        del out
+    finally:
+        shm.close()
+
+
+def analyze_conversation_texts(conversations_dir: Path, workers: int = 1) -> dict[str, dict]:
+    """Analyze full conversation text files, keyed by slug.
+
+    With workers > 1 the files are spread over a process pool. Workers write
+    their counts straight into a shared-memory TEXT_RESULT_DTYPE array, so
+    nothing but the row index is pickled back to the parent.
+    """
     results = {}
     if not conversations_dir.exists():
         return results
 
-    for md_file in sorted(conversations_dir.glob("*.md")):
-        text = md_file.read_text(encoding="utf-8")
-        result = analyze(text)
-        results[md_file.stem] = {
-            "file": md_file.name,
-            "void_percent": result["void_cluster"]["percent"],
-            "void_total": result["void_cluster"]["total"],
-            "total_tokens": result["total_tokens"],
-            "top_void_terms": dict(list(result["void_term_frequencies"].items())[:10]),
-        }
+    md_files = sorted(conversations_dir.glob("*.md"))
+    n_files = len(md_files)
+    if n_files == 0:
+        return results
+
+    shm = None
+    if workers > 1:
+        shm = shared_memory.SharedMemory(create=True, size=n_files * TEXT_RESULT_DTYPE.itemsize)
+        out = np.ndarray((n_files,), dtype=TEXT_RESULT_DTYPE, buffer=shm.buf)
+        out[:] = np.zeros(n_files, dtype=TEXT_RESULT_DTYPE)
+    else:
+        out = np.zeros(n_files, dtype=TEXT_RESULT_DTYPE)
+
+    try:
+        if shm is not None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(
+                    _text_row_worker,
+                    repeat(shm.name), repeat(n_files), range(n_files), md_files,
+                    chunksize=8,
+                ))
+        else:
+            for row, md_file in enumerate(md_files):
+                _fill_text_row(out, row, md_file)
+
+        for row, md_file in enumerate(md_files):
+            results[md_file.stem] = {
+                "file": md_file.name,
+                "void_percent": float(out["void_percent"][row]),
+                "void_total": int(out["void_total"][row]),
+                "total_tokens": int(out["total_tokens"][row]),
+                "top_void_terms": {
+                    str(term): int(count)
+                    for term, count in zip(out["top_terms"][row], out["top_counts"][row])
+                    if count
+                },
+            }
+    finally:
+        del out
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
     return results
 
 
+class MonthlySeries(NamedTuple):
+    """Per-month values the drift/volume detectors work on, in month order."""
+    months: tuple[str, ...]
+    densities: np.ndarray
+    counts: np.ndarray
+
+
 def compute_monthly_summary(
-    monthly_groups: dict[str, list[dict]],
+    conversations: ConversationIndex,
+    monthly_groups: dict[str, np.ndarray],
     text_results: dict[str, dict],
-) -> list[dict]:
-    """Compute per-month summary statistics."""
+) -> tuple[list[dict], MonthlySeries]:
+    """Compute per-month summary statistics.
+
+    Returns the report summaries plus a MonthlySeries built in the same
+    pass, so the detectors never re-derive the month sequence from dicts.
+    """
+    n_months = len(monthly_groups)
     summaries = []
+    densities = np.empty(n_months, dtype=np.float64)
+    counts = np.empty(n_months, dtype=np.int64)
 
-    for month, convs in monthly_groups.items():
-        title_analysis = analyze_title_void_density(convs)
+    for i, (month, rows) in enumerate(monthly_groups.items()):
+        titles = conversations.titles[rows]
+        dates = conversations.dates[rows]
+        title_analysis = analyze_title_void_density(titles)
+        densities[i] = title_analysis["void_proportion"]
+        counts[i] = len(rows)
 
         # Match conversations to text analysis results if available
         text_void_pcts = []
-        for conv in convs:
-            slug = conv.get("slug", "")
+        for slug in conversations.slugs[rows]:
             if slug in text_results:
                 text_void_pcts.append(text_results[slug]["void_percent"])
 
-        summaries.append({
+        summary = {
             "month": month,
-            "conversation_count": len(convs),
+            "conversation_count": len(rows),
             "title_void_density": title_analysis["void_proportion"],
             "title_void_count": title_analysis["void_count"],
             "text_analyses_available": len(text_void_pcts),
@@ -121,13 +258,16 @@ def compute_monthly_summary(
                 if text_void_pcts else None
             ),
             "text_void_max": max(text_void_pcts) if text_void_pcts else None,
-            "titles_with_void": title_analysis["void_titles"],
-        })
+        }
+        # Only months that actually had hits are re-scanned for the title list
+        if title_analysis["void_count"]:
+            summary["titles_with_void"] = collect_void_titles(titles, dates)
+        summaries.append(summary)
 
-    return summaries
+    return summaries, MonthlySeries(tuple(monthly_groups), densities, counts)
 
 
-def detect_drift(monthly_summaries: list[dict], threshold: float = 2.0) -> list[dict]:
+def detect_drift(series: MonthlySeries, threshold: float = 2.0) -> list[dict]:
     """
     Detect drift in void-cluster density across months.
 
@@ -135,126 +275,139 @@ def detect_drift(monthly_summaries: list[dict], threshold: float = 2.0) -> list[
     against the running mean of all previous months.
     """
     alerts = []
-    running_values = []
-
-    for summary in monthly_summaries:
-        density = summary["title_void_density"]
-        count = summary["conversation_count"]
-
-        if len(running_values) >= 2:
-            mean = sum(running_values) / len(running_values)
-            variance = sum((v - mean) ** 2 for v in running_values) / len(running_values)
-            std = math.sqrt(variance) if variance > 0 else 0.001
-
-            z = (density - mean) / std
-
-            if abs(z) > threshold:
-                alerts.append({
-                    "period": summary["month"],
-                    "density": density,
-                    "running_mean": round(mean, 6),
-                    "z_score": round(z, 2),
-                    "severity": "high" if abs(z) > 3.0 else "medium",
-                    "message": (
-                        f"Void density {density:.4%} deviates from running mean "
-                        f"{mean:.4%} (z={z:.2f}, n={count} conversations)"
-                    ),
-                })
-
-        running_values.append(density)
+    densities = series.densities
+    n = len(densities)
+    if n < 3:
+        return alerts
+
+    # Running mean/variance of months [0, i) for every i from prefix sums.
+    # Variance is taken on values shifted by the first month so E[x²] - E[x]²
+    # stays exactly 0 for a flat series instead of picking up rounding noise.
+    prior = np.arange(1, n)
+    mean = np.cumsum(densities)[:-1] / prior
+    shifted = densities - densities[0]
+    shifted_mean = np.cumsum(shifted)[:-1] / prior
+    variance = np.cumsum(shifted * shifted)[:-1] / prior - shifted_mean * shifted_mean
+    std = np.where(variance > 0, np.sqrt(np.clip(variance, 0, None)), 0.001)
+    z = (densities[1:] - mean) / std
+
+    # Month i needs at least two previous months (z index i - 1)
+    for i in np.flatnonzero(np.abs(z[1:]) > threshold) + 2:
+        density = float(densities[i])
+        month_mean = float(mean[i - 1])
+        month_z = float(z[i - 1])
+        alerts.append({
+            "period": series.months[i],
+            "density": density,
+            "running_mean": round(month_mean, 6),
+            "z_score": round(month_z, 2),
+            "severity": "high" if abs(month_z) > 3.0 else "medium",
+            "message": (
+                f"Void density {density:.4%} deviates from running mean "
+                f"{month_mean:.4%} (z={month_z:.2f}, n={series.counts[i]} conversations)"
+            ),
+        })
 
     return alerts
 
 
-def detect_volume_anomalies(monthly_summaries: list[dict]) -> list[dict]:
+def detect_volume_anomalies(series: MonthlySeries) -> list[dict]:
     """Flag months with unusually high or low conversation volume."""
     alerts = []
-    counts = [s["conversation_count"] for s in monthly_summaries]
-
+    counts = series.counts
     if len(counts) < 3:
         return alerts
 
-    mean = sum(counts) / len(counts)
-    variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+    mean = float(counts.mean())
+    variance = float(counts.var())
     std = math.sqrt(variance) if variance > 0 else 1
-
-    for summary in monthly_summaries:
-        z = (summary["conversation_count"] - mean) / std
-        if abs(z) > 2.0:
-            direction = "spike" if z > 0 else "drop"
-            alerts.append({
-                "period": summary["month"],
-                "count": summary["conversation_count"],
-                "mean": round(mean, 1),
-                "z_score": round(z, 2),
-                "severity": "info",
-                "message": (
-                    f"Volume {direction}: {summary['conversation_count']} conversations "
-                    f"(mean={mean:.0f}, z={z:.2f})"
-                ),
-            })
+    z = (counts - mean) / std
+
+    for i in np.flatnonzero(np.abs(z) > 2.0):
+        count = int(counts[i])
+        month_z = float(z[i])
+        direction = "spike" if month_z > 0 else "drop"
+        alerts.append({
+            "period": series.months[i],
+            "count": count,
+            "mean": round(mean, 1),
+            "z_score": round(month_z, 2),
+            "severity": "info",
+            "message": (
+                f"Volume {direction}: {count} conversations "
+                f"(mean={mean:.0f}, z={month_z:.2f})"
+            ),
+        })
 
     return alerts
 
 
-def format_markdown_report(
-    monthly_summaries: list[dict],
-    drift_alerts: list[dict],
-    volume_alerts: list[dict],
-    metadata: dict,
-) -> str:
-    """Format temporal analysis as a markdown report."""
-    lines = [
-        "# Temporal Pattern Analysis Report",
-        "",
-        f"**Generated:** {datetime.now().isoformat()}",
-        f"**Window:** {metadata.get('window_months', 7)} months",
-        f"**Total conversations:** {metadata.get('total_conversations', 'N/A')}",
-        "",
-    ]
-
-    # Monthly summary table
-    lines.extend([
-        "## Monthly Summary",
-        "",
-        "| Month | Sessions | Title Void Density | Text Analyses | Text Void Mean |",
-        "|-------|----------|-------------------|---------------|----------------|",
-    ])
-
+def _monthly_rows(monthly_summaries: list[dict]) -> Iterator[str]:
+    """Yield the monthly summary table."""
+    yield "## Monthly Summary"
+    yield ""
+    yield "| Month | Sessions | Title Void Density | Text Analyses | Text Void Mean |"
+    yield "|-------|----------|-------------------|---------------|----------------|"
     for s in monthly_summaries:
         text_mean = f"{s['text_void_mean']:.1f}%" if s["text_void_mean"] is not None else "—"
-        lines.append(
+        yield (
             f"| {s['month']} | {s['conversation_count']} | "
             f"{s['title_void_density']:.4%} | "
             f"{s['text_analyses_available']} | {text_mean} |"
         )
 
-    # Drift alerts
-    all_alerts = drift_alerts + volume_alerts
+
+def _alert_lines(all_alerts: list[dict]) -> Iterator[str]:
+    """Yield the alerts section (or the all-clear notice)."""
+    yield ""
     if all_alerts:
-        lines.extend(["", "## ⚠️ Alerts", ""])
+        yield "## ⚠️ Alerts"
+        yield ""
         for alert in all_alerts:
             icon = "🔴" if alert["severity"] == "high" else "🟡" if alert["severity"] == "medium" else "ℹ️"
-            lines.append(f"- {icon} **{alert['period']}**: {alert['message']}")
+            yield f"- {icon} **{alert['period']}**: {alert['message']}"
     else:
-        lines.extend(["", "## ✅ No Drift Detected", ""])
-        lines.append("All months within expected void-cluster density range.")
+        yield "## ✅ No Drift Detected"
+        yield ""
+        yield "All months within expected void-cluster density range."
 
-    # Volume distribution
-    lines.extend([
-        "",
-        "## Volume Distribution",
-        "",
-        "```",
-    ])
+
+def _volume_lines(monthly_summaries: list[dict]) -> Iterator[str]:
+    """Yield the volume distribution bar chart."""
+    yield ""
+    yield "## Volume Distribution"
+    yield ""
+    yield "```"
     max_count = max((s["conversation_count"] for s in monthly_summaries), default=1)
     for s in monthly_summaries:
         bar_len = int(40 * s["conversation_count"] / max_count) if max_count > 0 else 0
         bar = "█" * bar_len
-        lines.append(f"  {s['month']}  {bar} {s['conversation_count']}")
-    lines.append("```")
+        yield f"  {s['month']}  {bar} {s['conversation_count']}"
+    yield "```"
 
-    return "\n".join(lines)
+
+def format_markdown_report(
+    monthly_summaries: list[dict],
+    drift_alerts: list[dict],
+    volume_alerts: list[dict],
+    metadata: dict,
+) -> str:
+    """Format temporal analysis as a markdown report."""
+    header = (
+        "# Temporal Pattern Analysis Report",
+        "",
+        f"**Generated:** {metadata.get('generated_at') or datetime.now().isoformat()}",
+        f"**Window:** {metadata.get('window_months', 7)} months",
+        f"**Total conversations:** {metadata.get('total_conversations', 'N/A')}",
+        "",
+    )
+
+    return "\n".join(chain(
+        header,
+        _monthly_rows(monthly_summaries),
+        _alert_lines(drift_alerts + volume_alerts),
+        _volume_lines(monthly_summaries),
+    ))
 
 
 def main():
@@ -264,11 +417,13 @@ def main():
     parser.add_argument("--window", type=int, default=7, help="Analysis window in months")
     parser.add_argument("--output", type=Path, required=True, help="Output JSON report")
     parser.add_argument("--markdown", type=Path, default=None, help="Output markdown report")
+    parser.add_argument("--workers", type=int, default=1, help="Processes for conversation text analysis")
     args = parser.parse_args()
 
     # Load data
     index = load_index(args.index)
-    conversations = index.get("conversations", [])
+    conversations = index["conversations"]
+    conversations = conversations.take(np.argsort(conversations.dates, kind="stable"))
 
     # Group by month
     monthly = group_by_month(conversations)
@@ -276,18 +431,18 @@ def main():
     # Analyze conversation texts if directory provided
     text_results = {}
     if args.conversations and args.conversations.exists():
-        text_results = analyze_conversation_texts(args.conversations)
+        text_results = analyze_conversation_texts(args.conversations, workers=args.workers)
 
     # Compute summaries
-    monthly_summaries = compute_monthly_summary(monthly, text_results)
+    monthly_summaries, series = compute_monthly_summary(conversations, monthly, text_results)
 
     # Detect anomalies
-    drift_alerts = detect_drift(monthly_summaries)
-    volume_alerts = detect_volume_anomalies(monthly_summaries)
+    drift_alerts = detect_drift(series)
+    volume_alerts = detect_volume_anomalies(series)
 
     metadata = {
         "window_months": args.window,
-        "total_conversations": len(conversations),
+        "total_conversations": len(conversations.slugs),
         "date_range": index.get("date_range", {}),
         "generated_at": datetime.now().isoformat(),
     }
@@ -313,7 +468,7 @@ def main():
 
     # Print summary
     print(f"\n  Months analyzed: {len(monthly_summaries)}")
-    print(f"  Conversations: {len(conversations)}")
+    print(f"  Conversations: {len(conversations.slugs)}")
     print(f"  Text files analyzed: {len(text_results)}")
     print(f"  Alerts: {len(drift_alerts + volume_alerts)}")
 
@@ -4,11 +4,118 @@ Comprehensive title-level statistical analysis for Grok chat corpus.
 Goes beyond void/dissolution to detect ANY anomalous patterns.
 """
 
+import heapq
 import re
 import json
 from collections import Counter, defaultdict
 from datetime import datetime
-import math
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+from scipy.stats import chisquare
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_WORD_RE = re.compile(r'[a-z]+')
+_ANYWORD_RE = re.compile(r'\w+')
+
+# Title-generation markers. Gerund prefixes go straight to str.startswith;
+# informal markers are substrings (punctuation included), so they are folded
+# into one alternation; subjective terms keep list order because the first
+# match in that order is the one reported.
+_GERUND_PREFIXES = ('Installing', 'Securing', 'Ensuring', 'Fixing', 'Debloating',
+                    'Transporting', 'Binding', 'Sharing', 'Resuming', 'Greeting',
+                    'Solving', 'Contacting')
+_INFORMAL_MARKERS = ('Hi,', 'I\'m', 'What\'s', 'Another', 'Simple', 'Annoying',
+                     'Homework', '?', '!')
+_INFORMAL_RE = re.compile('|'.join(map(re.escape, _INFORMAL_MARKERS)))
+_SUBJECTIVE_TERMS = ('annoying', 'obvious', 'frustration', 'friendly', 'motivational',
+                     'caution', 'urgency', 'profitable', 'kawaii', 'fun', 'best',
+                     'simple', 'comprehensive', 'authoritative', 'innovative')
+
+# Semantic clusters probed by the anomaly scan, as frozensets of title tokens.
+_SEMANTIC_CLUSTERS = {
+    'void/dissolution': frozenset({
+        'void', 'abyss', 'emptiness', 'vacuum', 'hollow', 'blank', 'empty',
+        'shadow', 'ghost', 'vanish', 'dissolve', 'silence', 'absence',
+        'darkness', 'dark', 'night', 'fade', 'shatter', 'crumble',
+        'collapse', 'decay', 'oblivion', 'forgotten', 'desolate'
+    }),
+    'violence/destruction': frozenset({
+        'kill', 'destroy', 'attack', 'battle', 'fight', 'war', 'weapon',
+        'gun', 'shoot', 'assault', 'combat', 'punching', 'confrontational',
+        'ballistics', 'scam', 'exposed', 'threat', 'urgency'
+    }),
+    'emotion/sentiment': frozenset({
+        'love', 'hate', 'fear', 'joy', 'anger', 'frustration', 'annoying',
+        'friendly', 'motivational', 'caution', 'kawaii', 'fun', 'legacy'
+    }),
+    'existential/philosophical': frozenset({
+        'existence', 'consciousness', 'meaning', 'purpose', 'reality',
+        'truth', 'ethics', 'constitution', 'soul', 'spirit', 'mind'
+    }),
+    'death/mortality': frozenset({
+        'death', 'dead', 'die', 'dying', 'cremated', 'remains', 'grave',
+        'funeral', 'mortality', 'farewell', 'retirement', 'closure',
+        'extinction', 'ending'
+    }),
+    'transformation/change': frozenset({
+        'transformation', 'evolution', 'innovation', 'revolution',
+        'enhancement', 'optimization', 'rewriting', 'replacement',
+        'flip', 'debloating', 'fixing'
+    })
+}
+
+def _invert_clusters(clusters):
+    """Map each cluster term to the names of the clusters containing it."""
+    term_clusters = {}
+    for cluster_name, terms in clusters.items():
+        for term in terms:
+            term_clusters.setdefault(term, []).append(cluster_name)
+    return term_clusters
+
+# Inverted once so each title's tokens are looked up in a single pass,
+# however many clusters there are.
+_TERM_CLUSTERS = _invert_clusters(_SEMANTIC_CLUSTERS)
+
+_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'from', 'its', 'how', 'are', 'was',
+                        'has', 'had', 'not', 'but', 'all', 'can', 'her', 'his', 'its',
+                        'this', 'that', 'these', 'than', 'into', 'also', 'been', 'have',
+                        'will', 'more', 'when', 'who', 'what', 'where', 'which', 'some',
+                        'only', 'very', 'just', 'about', 'over', 'such', 'after', 'most',
+                        'each', 'other', 'both', 'new', 'made', 'them', 'being', 'does',
+                        'did', 'their', 'there', 'here', 'they'})
+
+# Substring keywords -> labels for the user-profile baseline.
+_KEYWORD_MAPS = {
+    'tech_stack': {
+        'python': 'Python', 'powershell': 'PowerShell', 'masm64': 'MASM64/x86 ASM',
+        'directx': 'DirectX', 'unity': 'Unity', 'github': 'GitHub',
+        'node': 'Node.js', 'sqlite': 'SQLite', 'ios': 'iOS', 'xcode': 'Xcode',
+        'windows': 'Windows', 'basic': 'GW-BASIC', 'sonic': 'SONiC',
+        'javascript': 'JavaScript', 'puter': 'Puter.js'
+    },
+    'interests': {
+        'yu-gi-oh': 'Yu-Gi-Oh', 'ccg': 'Card Games', 'chess': 'Chess',
+        'fighting': 'Fighting Games', 'ballistics': 'Ballistics/Firearms',
+        'wrestling': 'Wrestling', 'anime': 'Anime/Manga', 'kawaii': 'Anime/Manga',
+        'emiru': 'Twitch/Streaming', 'football': 'Sports', 'diablo': 'Gaming',
+        'ff6': 'Retro Gaming'
+    },
+    'locations': {
+        'wheatland': 'Wheatland, WY', 'wyoming': 'Wyoming', 'glendo': 'Glendo, WY',
+        'santa fe': 'Santa Fe, NM', 'san clemente': 'San Clemente, CA'
+    }
+}
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Pre-split copy of RAW_DATA; the inline table below is used when it is absent.
+TITLES_JSON = PROJECT_ROOT / "data" / "analysis" / "titles.json"
 
 # Parse the conversation history from the markdown
 RAW_DATA = """
@@ -155,48 +262,127 @@ Rock Paper Scissors Game in MASM64|2025-07-19|Technical/Programming
 Homework Help Request|2025-07-19|Personal/Misc
 """
 
-def parse_data(raw):
-    conversations = []
+class Conversation(NamedTuple):
+    """One parsed title row, with the lowercased/tokenized forms cached."""
+    title: str
+    title_lower: str
+    title_tokens: frozenset[str]   # \w+ tokens, for cluster membership tests
+    title_words: tuple[str, ...]   # ordered [a-z]+ words, for frequency/bigrams
+    date: Optional[datetime]
+    date_iso: str                  # 'YYYY-MM-DD', or '?' when undated
+    category: str
+    primary: str
+    month: str
+    day_of_week: str
+
+def split_raw_data(raw):
+    """Yield ``(title, date_str, category)`` rows from the inline ``|`` table."""
     for line in raw.strip().split('\n'):
         parts = line.strip().split('|')
         if len(parts) == 3:
-            title, date_str, category = parts
-            try:
-                date = datetime.strptime(date_str.strip(), '%Y-%m-%d')
-            except:
-                date = None
-            conversations.append({
-                'title': title.strip(),
-                'date': date,
-                'category': category.strip(),
-                'month': date.strftime('%Y-%m') if date else 'unknown',
-                'day_of_week': date.strftime('%A') if date else 'unknown',
-            })
-    return conversations
-
-def title_structure_analysis(convos):
-    """Analyze the structural patterns of titles."""
-    print("=" * 70)
-    print("TITLE STRUCTURE ANALYSIS")
-    print("=" * 70)
-    
-    # Title length distribution
-    lengths = [len(c['title']) for c in convos]
-    word_counts = [len(c['title'].split()) for c in convos]
-    
-    mean_len = sum(lengths) / len(lengths)
-    mean_words = sum(word_counts) / len(word_counts)
-    std_len = math.sqrt(sum((l - mean_len)**2 for l in lengths) / len(lengths))
-    std_words = math.sqrt(sum((w - mean_words)**2 for w in word_counts) / len(word_counts))
-    
-    print(f"\nTitle Character Length: mean={mean_len:.1f}, std={std_len:.1f}, min={min(lengths)}, max={max(lengths)}")
-    print(f"Title Word Count: mean={mean_words:.1f}, std={std_words:.1f}, min={min(word_counts)}, max={max(word_counts)}")
-    
-    # Title format patterns
-    colon_titles = [c for c in convos if ':' in c['title']]
-    print(f"\nTitles with colon separator: {len(colon_titles)}/{len(convos)} ({100*len(colon_titles)/len(convos):.1f}%)")
-    
-    # Identify title naming patterns
+            yield tuple(part.strip() for part in parts)
+
+def load_rows(path=TITLES_JSON, raw=RAW_DATA):
+    """Iterate title rows from the JSON sidecar, falling back to ``raw``.
+
+    The sidecar holds ``{"t": title, "d": "YYYY-MM-DD", "c": category}``
+    objects; ``d`` is null for undated titles.
+    """
+    try:
+        with open(path, 'rb') as f:
+            rows = _json_loads(f.read())
+    except FileNotFoundError:
+        return split_raw_data(raw)
+    return ((r['t'], r['d'] or '', r['c']) for r in rows)
+
+def iter_conversations(rows=None):
+    """Yield a Conversation per ``(title, date_str, category)`` row.
+
+    ``rows`` defaults to load_rows(). Aggregate-only callers can consume
+    this directly; parse_data keeps the materialized table.
+    """
+    if rows is None:
+        rows = load_rows()
+    for title, date_str, category in rows:
+        # ISO dates only, so fromisoformat (a C parser) stands in for strptime
+        try:
+            date = datetime.fromisoformat(date_str)
+        except ValueError:
+            date = None
+        date_iso = date.date().isoformat() if date else '?'
+        title_lower = title.lower()
+        yield Conversation(
+            title=title,
+            title_lower=title_lower,
+            title_tokens=frozenset(_ANYWORD_RE.findall(title_lower)),
+            title_words=tuple(_WORD_RE.findall(title_lower)),
+            date=date,
+            date_iso=date_iso,
+            category=category,
+            primary=category.split('/')[0],
+            month=date_iso[:7] if date else 'unknown',
+            day_of_week=date.strftime('%A') if date else 'unknown',
+        )
+
+def parse_data(rows):
+    """Build the immutable tuple of Conversation records from ``rows``."""
+    return tuple(iter_conversations(rows))
+
+class ConversationArrays(NamedTuple):
+    """Column-wise view of the parsed table for NumPy reductions."""
+    lengths: np.ndarray               # int64 title length in characters
+    dates: np.ndarray                 # datetime64[D], NaT when undated
+    months: np.ndarray                # 'YYYY-MM' or 'unknown'
+    primary_ids: np.ndarray           # int8 index into primary_names
+    primary_names: tuple[str, ...]    # primary categories in first-seen order
+
+def build_arrays(convos):
+    """Lay the parsed records out as parallel arrays (one per field)."""
+    primary_index = {}
+    for c in convos:
+        primary_index.setdefault(c.primary, len(primary_index))
+    return ConversationArrays(
+        lengths=np.fromiter((len(c.title) for c in convos), dtype=np.int64, count=len(convos)),
+        dates=np.array([c.date.date() if c.date else None for c in convos], dtype='datetime64[D]'),
+        months=np.array([c.month for c in convos]),
+        primary_ids=np.fromiter((primary_index[c.primary] for c in convos), dtype=np.int8, count=len(convos)),
+        primary_names=tuple(primary_index),
+    )
+
+# Parsed once at import; every analysis reads this immutable table.
+CONVERSATIONS = parse_data(load_rows())
+ARRAYS = build_arrays(CONVERSATIONS)
+
+class AnalysisState(NamedTuple):
+    """Accumulators filled by analyze_all and shared by every report."""
+    word_counts: np.ndarray
+    patterns: dict[str, int]
+    unusual: list[str]
+    cluster_matches: dict[str, list]
+    cluster_names: tuple[str, ...]
+    cluster_hits: np.ndarray       # bool (title, cluster) incidence matrix
+    freq: Counter
+    bigram_freq: Counter
+    prefix_freq: Counter
+    informal: list[str]
+    subjective: list[str]
+    title_counts: Counter
+    title_dates: dict[str, list[str]]
+    subcategory: Counter
+    by_date: dict[str, list[Conversation]]
+    monthly_cats: dict[str, Counter]
+    ballistics: list[Conversation]
+    grok_meta: list[Conversation]
+
+def analyze_all(convos):
+    """Collect every per-title statistic in a single pass over the corpus.
+
+    Every report reads from the returned AnalysisState, so each title is
+    visited once no matter how many views are printed. ``convos`` may be any
+    iterable, including iter_conversations() when no table is needed.
+    """
+    # Structure accumulators
+    word_counts = []
     patterns = {
         'Topic: Subtitle': 0,
         'Gerund phrase': 0,
@@ -205,19 +391,116 @@ def title_structure_analysis(convos):
         'Action phrase': 0,
         'Comparison (vs/versus)': 0,
     }
+    unusual = []
+    # Semantic accumulators
+    cluster_matches = {cluster_name: [] for cluster_name in _SEMANTIC_CLUSTERS}
+    cluster_names = tuple(_SEMANTIC_CLUSTERS)
+    cluster_rows = []
+    freq = Counter()
+    bigram_freq = Counter()
+    # Title-generation accumulators
+    prefix_freq = Counter()
+    informal = []
+    subjective_hits = []
+    title_counts = Counter()
+    title_dates = defaultdict(list)
+    # Topic/temporal/summary accumulators
+    subcategory = Counter()
+    by_date = defaultdict(list)
+    monthly_cats = defaultdict(Counter)
+    ballistics = []
+    grok_meta = []
     
     for c in convos:
-        t = c['title']
-        if ':' in t:
+        t = c.title
+        t_lower = c.title_lower
+        
+        word_counts.append(len(t.split()))
+        prefix, colon, _ = t.partition(':')
+        if colon:
             patterns['Topic: Subtitle'] += 1
-        if any(t.startswith(w) for w in ['Installing', 'Securing', 'Ensuring', 'Fixing', 'Debloating',
-                                           'Transporting', 'Binding', 'Sharing', 'Resuming', 'Greeting',
-                                           'Solving', 'Contacting']):
+            prefix_freq[prefix.strip()] += 1
+        if t.startswith(_GERUND_PREFIXES):
             patterns['Gerund phrase'] += 1
         if '?' in t or 'Inquiry' in t:
             patterns['Question/Inquiry'] += 1
-        if ' vs ' in t.lower() or ' vs. ' in t.lower() or ' versus ' in t.lower():
+        if ' vs ' in t_lower or ' vs. ' in t_lower or ' versus ' in t_lower:
             patterns['Comparison (vs/versus)'] += 1
+        
+        if t[0].islower():
+            unusual.append(f"Lowercase start: '{t}'")
+        if '×' in t or '×2' in t:
+            unusual.append(f"Has multiplication: '{t}'")
+        if '!' in t:
+            unusual.append(f"Has exclamation: '{t}'")
+        if t.count(':') > 1:
+            unusual.append(f"Multiple colons: '{t}'")
+        
+        hits_by_cluster = defaultdict(set)
+        for token in c.title_tokens:
+            for cluster_name in _TERM_CLUSTERS.get(token, ()):
+                hits_by_cluster[cluster_name].add(token)
+        for cluster_name, hits in hits_by_cluster.items():
+            cluster_matches[cluster_name].append((t, c.date_iso, c.category, hits))
+        cluster_rows.append([name in hits_by_cluster for name in cluster_names])
+        count_title_terms(c.title_words, _STOPWORDS, freq, bigram_freq)
+        
+        if _INFORMAL_RE.search(t):
+            informal.append(f"{t} [{c.date_iso}]")
+        for word in _SUBJECTIVE_TERMS:
+            if word in t_lower:
+                subjective_hits.append(f"[{word}] {t} ({c.category})")
+                break
+        title_counts[t] += 1
+        if c.date:
+            title_dates[t].append(c.date_iso)
+            by_date[c.date_iso].append(c)
+        
+        subcategory[c.category] += 1
+        monthly_cats[c.month][c.primary] += 1
+        if 'ballistic' in t_lower:
+            ballistics.append(c)
+        if 'grok' in t_lower:
+            grok_meta.append(c)
+    
+    return AnalysisState(
+        word_counts=np.array(word_counts, dtype=np.int64),
+        patterns=patterns,
+        unusual=unusual,
+        cluster_matches=cluster_matches,
+        cluster_names=cluster_names,
+        cluster_hits=np.array(cluster_rows, dtype=bool).reshape(-1, len(cluster_names)),
+        freq=freq,
+        bigram_freq=bigram_freq,
+        prefix_freq=prefix_freq,
+        informal=informal,
+        subjective=subjective_hits,
+        title_counts=title_counts,
+        title_dates=title_dates,
+        subcategory=subcategory,
+        by_date=by_date,
+        monthly_cats=monthly_cats,
+        ballistics=ballistics,
+        grok_meta=grok_meta,
+    )
+
+def title_structure_analysis(convos, state, arrays):
+    """Analyze the structural patterns of titles."""
+    print("=" * 70)
+    print("TITLE STRUCTURE ANALYSIS")
+    print("=" * 70)
+    
+    # Title length distribution (population std, reduced in NumPy)
+    lengths = arrays.lengths
+    word_counts = state.word_counts
+    
+    print(f"\nTitle Character Length: mean={lengths.mean():.1f}, std={lengths.std():.1f}, min={lengths.min()}, max={lengths.max()}")
+    print(f"Title Word Count: mean={word_counts.mean():.1f}, std={word_counts.std():.1f}, min={word_counts.min()}, max={word_counts.max()}")
+    
+    # Title format patterns
+    patterns = state.patterns
+    n_colon = patterns['Topic: Subtitle']
+    print(f"\nTitles with colon separator: {n_colon}/{len(convos)} ({100*n_colon/len(convos):.1f}%)")
     
     print("\nTitle Pattern Distribution:")
     for pattern, count in sorted(patterns.items(), key=lambda x: -x[1]):
@@ -227,108 +510,82 @@ def title_structure_analysis(convos):
     # Outlier titles (unusually short or long)
     print("\n--- OUTLIER TITLES (by length) ---")
     print("Shortest:")
-    for c in sorted(convos, key=lambda x: len(x['title']))[:5]:
-        print(f"  [{len(c['title'])}ch] {c['title']}")
+    for i in heapq.nsmallest(5, range(len(convos)), key=lengths.__getitem__):
+        print(f"  [{lengths[i]}ch] {convos[i].title}")
     print("Longest:")
-    for c in sorted(convos, key=lambda x: -len(x['title']))[:5]:
-        print(f"  [{len(c['title'])}ch] {c['title']}")
+    for i in heapq.nlargest(5, range(len(convos)), key=lengths.__getitem__):
+        print(f"  [{lengths[i]}ch] {convos[i].title}")
     
     # Titles with unusual characters or structures
     print("\n--- STRUCTURALLY UNUSUAL TITLES ---")
-    for c in convos:
-        t = c['title']
-        if t[0].islower():
-            print(f"  Lowercase start: '{t}'")
-        if '×' in t or '×2' in t:
-            print(f"  Has multiplication: '{t}'")
-        if '!' in t:
-            print(f"  Has exclamation: '{t}'")
-        if t.count(':') > 1:
-            print(f"  Multiple colons: '{t}'")
-        if any(c.isdigit() for c in t) and not any(w in t for w in ['2025', '2026', '100', '2.5D', '4U', 'Gen 1', 'P2P', 'Win', '11', '3', '18']):
-            pass  # many have numbers, not unusual
+    for line in state.unusual:
+        print(f"  {line}")
 
-def topic_distribution(convos):
+def topic_distribution(convos, state, arrays):
     """Detailed topic distribution analysis."""
     print("\n" + "=" * 70)
     print("TOPIC DISTRIBUTION ANALYSIS")
     print("=" * 70)
     
-    # Primary category counts
-    primary = Counter()
-    subcategory = Counter()
-    for c in convos:
-        cat = c['category']
-        primary[cat.split('/')[0]] += 1
-        subcategory[cat] += 1
+    subcategory = state.subcategory
+    by_date = state.by_date
     
+    # Primary categories: ids are first-seen order, so a stable sort on
+    # -count keeps most_common()'s tie order
+    primary = np.bincount(arrays.primary_ids, minlength=len(arrays.primary_names))
     print("\nPrimary Categories:")
-    for cat, count in primary.most_common():
-        print(f"  {cat}: {count} ({100*count/len(convos):.1f}%)")
+    for i in np.argsort(-primary, kind='stable'):
+        count = primary[i]
+        print(f"  {arrays.primary_names[i]}: {count} ({100*count/len(convos):.1f}%)")
     
     print("\nSubcategories:")
     for cat, count in subcategory.most_common():
         print(f"  {cat}: {count} ({100*count/len(convos):.1f}%)")
     
-    # Technical sub-topic diversity
-    tech_topics = [c for c in convos if c['category'].startswith('Technical')]
-    tech_subcats = Counter(c['category'] for c in tech_topics)
-    print(f"\nTechnical topic diversity: {len(tech_subcats)} subcategories across {len(tech_topics)} conversations")
+    # Technical sub-topic diversity, read off the subcategory counts
+    tech_subcats = {cat: n for cat, n in subcategory.items() if cat.startswith('Technical')}
+    print(f"\nTechnical topic diversity: {len(tech_subcats)} subcategories across {sum(tech_subcats.values())} conversations")
     
     # Cross-topic sessions (same day, different categories)
-    by_date = defaultdict(list)
-    for c in convos:
-        if c['date']:
-            by_date[c['date'].strftime('%Y-%m-%d')].append(c)
-    
     print("\n--- HIGH-ACTIVITY DAYS (4+ sessions) ---")
     for date, sessions in sorted(by_date.items(), key=lambda x: -len(x[1])):
         if len(sessions) >= 4:
-            cats = [s['category'].split('/')[0] for s in sessions]
+            cats = [s.primary for s in sessions]
             print(f"  {date}: {len(sessions)} sessions — {dict(Counter(cats))}")
 
-def temporal_analysis(convos):
+def temporal_analysis(convos, state, arrays):
     """Temporal pattern analysis."""
     print("\n" + "=" * 70)
     print("TEMPORAL ANALYSIS")
     print("=" * 70)
     
-    # Monthly distribution
-    monthly = Counter()
-    for c in convos:
-        monthly[c['month']] += 1
+    # Monthly distribution (np.unique returns the months sorted)
+    months, month_counts = np.unique(arrays.months, return_counts=True)
     
     print("\nMonthly Session Count:")
-    for month in sorted(monthly.keys()):
-        count = monthly[month]
+    for month, count in zip(months, month_counts):
         bar = '#' * count
         print(f"  {month}: {count:3d} {bar}")
     
-    # Day-of-week distribution (where known)
-    dow = Counter()
-    for c in convos:
-        if c['day_of_week'] != 'unknown':
-            dow[c['day_of_week']] += 1
+    # Day-of-week distribution (where known); day 0 of the epoch,
+    # 1970-01-01, was a Thursday, so shifting by 3 makes Monday 0
+    dates = arrays.dates[~np.isnat(arrays.dates)]
+    observed = np.bincount((dates.astype(np.int64) + 3) % 7, minlength=7)
     
     day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     print("\nDay-of-Week Distribution:")
-    for day in day_order:
-        count = dow.get(day, 0)
+    for day, count in zip(day_order, observed):
         print(f"  {day:10s}: {count:3d} {'#' * count}")
     
     # Chi-squared test for uniform day-of-week
-    total_dow = sum(dow.values())
-    expected = total_dow / 7
-    chi2 = sum((dow.get(d, 0) - expected)**2 / expected for d in day_order)
-    print(f"\n  Chi-squared (uniform DOW): X2={chi2:.2f}, df=6")
+    expected = sum(observed) / 7
+    chi2, p_value = chisquare(observed)
+    print(f"\n  Chi-squared (uniform DOW): X2={chi2:.2f}, df=6, p={p_value:.4f}")
     print(f"  Expected per day: {expected:.1f}")
     
     # Category evolution over time
     print("\n--- TOPIC EVOLUTION BY MONTH ---")
-    monthly_cats = defaultdict(lambda: Counter())
-    for c in convos:
-        primary = c['category'].split('/')[0]
-        monthly_cats[c['month']][primary] += 1
+    monthly_cats = state.monthly_cats
     
     for month in sorted(monthly_cats.keys()):
         cats = monthly_cats[month]
@@ -336,130 +593,71 @@ def temporal_analysis(convos):
         cat_str = ', '.join(f"{k}:{v}" for k, v in cats.most_common())
         print(f"  {month} (n={total}): {cat_str}")
     
-    # Session gaps (days between sessions)
-    dates = sorted(set(c['date'] for c in convos if c['date']))
-    gaps = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
-    if gaps:
-        mean_gap = sum(gaps) / len(gaps)
-        max_gap = max(gaps)
-        max_gap_idx = gaps.index(max_gap)
+    # Session gaps (days between distinct session dates)
+    session_days = np.unique(dates)
+    gaps = np.diff(session_days).astype(np.int64)
+    if gaps.size:
+        max_gap_idx = int(gaps.argmax())
         print(f"\nSession Gap Analysis:")
-        print(f"  Mean gap: {mean_gap:.1f} days")
-        print(f"  Max gap: {max_gap} days (between {dates[max_gap_idx].strftime('%Y-%m-%d')} and {dates[max_gap_idx+1].strftime('%Y-%m-%d')})")
+        print(f"  Mean gap: {gaps.mean():.1f} days")
+        print(f"  Max gap: {gaps[max_gap_idx]} days (between {session_days[max_gap_idx]} and {session_days[max_gap_idx+1]})")
         print(f"  Gaps > 7 days:")
-        for i, g in enumerate(gaps):
-            if g > 7:
-                print(f"    {dates[i].strftime('%Y-%m-%d')} → {dates[i+1].strftime('%Y-%m-%d')}: {g} days")
+        for i in np.flatnonzero(gaps > 7):
+            print(f"    {session_days[i]} → {session_days[i+1]}: {gaps[i]} days")
+
+def count_title_terms(title_words, stopwords, freq, bigram_freq):
+    """Add one title's content words and adjacent-word bigrams to the counts.
+
+    Words shorter than three letters or in ``stopwords`` are left out of the
+    word counts; bigrams pair consecutive words of two or more letters and are
+    keyed by ``(first, second)`` tuples, so no joined string is built per pair.
+    """
+    words = [w for w in title_words if len(w) > 1]
+    freq.update(w for w in words if len(w) > 2 and w not in stopwords)
+    bigram_freq.update(zip(words, words[1:]))
 
-def semantic_anomaly_scan(convos):
+def semantic_anomaly_scan(convos, state):
     """Scan for ANY unexpected semantic content in a technical corpus."""
     print("\n" + "=" * 70)
     print("SEMANTIC ANOMALY SCAN (BEYOND VOID)")
     print("=" * 70)
     
-    # Define multiple semantic clusters to check
-    clusters = {
-        'void/dissolution': {
-            'void', 'abyss', 'emptiness', 'vacuum', 'hollow', 'blank', 'empty',
-            'shadow', 'ghost', 'vanish', 'dissolve', 'silence', 'absence',
-            'darkness', 'dark', 'night', 'fade', 'shatter', 'crumble',
-            'collapse', 'decay', 'oblivion', 'forgotten', 'desolate'
-        },
-        'violence/destruction': {
-            'kill', 'destroy', 'attack', 'battle', 'fight', 'war', 'weapon',
-            'gun', 'shoot', 'assault', 'combat', 'punching', 'confrontational',
-            'ballistics', 'scam', 'exposed', 'threat', 'urgency'
-        },
-        'emotion/sentiment': {
-            'love', 'hate', 'fear', 'joy', 'anger', 'frustration', 'annoying',
-            'friendly', 'motivational', 'caution', 'kawaii', 'fun', 'legacy'
-        },
-        'existential/philosophical': {
-            'existence', 'consciousness', 'meaning', 'purpose', 'reality',
-            'truth', 'ethics', 'constitution', 'soul', 'spirit', 'mind'
-        },
-        'death/mortality': {
-            'death', 'dead', 'die', 'dying', 'cremated', 'remains', 'grave',
-            'funeral', 'mortality', 'farewell', 'retirement', 'closure',
-            'extinction', 'ending'
-        },
-        'transformation/change': {
-            'transformation', 'evolution', 'innovation', 'revolution',
-            'enhancement', 'optimization', 'rewriting', 'replacement',
-            'flip', 'debloating', 'fixing'
-        }
-    }
+    cluster_counts = state.cluster_hits.sum(axis=0)
+    for cluster_name, count in zip(state.cluster_names, cluster_counts):
+        rate = count / len(convos) * 100
+        print(f"\n{cluster_name.upper()}: {count}/{len(convos)} titles ({rate:.1f}%)")
+        for title, date_iso, cat, hits in state.cluster_matches[cluster_name]:
+            print(f"  [{date_iso}] [{cat}] {title} — matched: {hits}")
     
-    for cluster_name, terms in clusters.items():
-        matches = []
-        for c in convos:
-            title_lower = c['title'].lower()
-            title_words = set(re.findall(r'\w+', title_lower))
-            hits = title_words & terms
-            if hits:
-                matches.append((c['title'], c['date'], c['category'], hits))
-        
-        rate = len(matches) / len(convos) * 100
-        print(f"\n{cluster_name.upper()}: {len(matches)}/{len(convos)} titles ({rate:.1f}%)")
-        for title, date, cat, hits in matches:
-            date_str = date.strftime('%Y-%m-%d') if date else '?'
-            print(f"  [{date_str}] [{cat}] {title} — matched: {hits}")
+    # Per-title attribution: rows of the incidence matrix hitting 2+ clusters
+    print("\n--- TITLES SPANNING MULTIPLE CLUSTERS ---")
+    for i in np.flatnonzero(state.cluster_hits.sum(axis=1) >= 2):
+        names = ', '.join(state.cluster_names[j] for j in np.flatnonzero(state.cluster_hits[i]))
+        print(f"  [{convos[i].date_iso}] {convos[i].title} — {names}")
     
     # Word frequency across all titles
     print("\n--- ALL-TITLE WORD FREQUENCY (top 40) ---")
-    all_words = []
-    stopwords = {'the', 'and', 'for', 'with', 'from', 'its', 'how', 'are', 'was',
-                 'has', 'had', 'not', 'but', 'all', 'can', 'her', 'his', 'its',
-                 'this', 'that', 'these', 'than', 'into', 'also', 'been', 'have',
-                 'will', 'more', 'when', 'who', 'what', 'where', 'which', 'some',
-                 'only', 'very', 'just', 'about', 'over', 'such', 'after', 'most',
-                 'each', 'other', 'both', 'new', 'made', 'them', 'being', 'does',
-                 'did', 'their', 'there', 'here', 'they'}
-    
-    for c in convos:
-        words = re.findall(r'[a-z]+', c['title'].lower())
-        all_words.extend(w for w in words if len(w) > 2 and w not in stopwords)
-    
-    freq = Counter(all_words)
-    for word, count in freq.most_common(40):
+    for word, count in state.freq.most_common(40):
         print(f"  {word:25s}: {count}")
     
     # Bigram analysis
     print("\n--- TITLE BIGRAM FREQUENCY (top 20) ---")
-    all_bigrams = []
-    for c in convos:
-        words = re.findall(r'[a-z]+', c['title'].lower())
-        words = [w for w in words if len(w) > 1]
-        for i in range(len(words) - 1):
-            all_bigrams.append(f"{words[i]} {words[i+1]}")
-    
-    bigram_freq = Counter(all_bigrams)
-    for bigram, count in bigram_freq.most_common(20):
+    for bigram, count in state.bigram_freq.most_common(20):
         if count >= 2:
-            print(f"  {bigram:35s}: {count}")
+            print(f"  {' '.join(bigram):35s}: {count}")
 
-def grok_title_generation_analysis(convos):
+def grok_title_generation_analysis(convos, state):
     """Analyze patterns specific to Grok's auto-title generation."""
     print("\n" + "=" * 70)
     print("GROK TITLE GENERATION PATTERN ANALYSIS")
     print("=" * 70)
     
     # Title structure: "Topic: Description" is a common AI pattern
-    colon_split = []
-    for c in convos:
-        if ':' in c['title']:
-            parts = c['title'].split(':', 1)
-            colon_split.append({
-                'prefix': parts[0].strip(),
-                'suffix': parts[1].strip(),
-                'full': c['title'],
-                'category': c['category']
-            })
-    
-    print(f"\nColon-structured titles: {len(colon_split)}/{len(convos)} ({100*len(colon_split)/len(convos):.1f}%)")
+    prefix_freq = state.prefix_freq
+    n_colon = sum(prefix_freq.values())
+    print(f"\nColon-structured titles: {n_colon}/{len(convos)} ({100*n_colon/len(convos):.1f}%)")
     
     # Check for formulaic prefixes
-    prefix_freq = Counter(c['prefix'] for c in colon_split)
     print("\nRepeated prefixes:")
     for prefix, count in prefix_freq.most_common():
         if count >= 2:
@@ -467,33 +665,19 @@ def grok_title_generation_analysis(convos):
     
     # Titles that look like they were human-written vs AI-generated
     print("\n--- LIKELY USER-ENTERED TITLES (informal/conversational) ---")
-    informal_markers = ['Hi,', 'I\'m', 'What\'s', 'Another', 'Simple', 'Annoying',
-                        'Homework', '?', '!']
-    for c in convos:
-        for marker in informal_markers:
-            if marker in c['title']:
-                print(f"  {c['title']} [{c['date'].strftime('%Y-%m-%d') if c['date'] else '?'}]")
-                break
+    for line in state.informal:
+        print(f"  {line}")
     
     # Emotional/subjective language in titles (unusual for auto-generated)
     print("\n--- TITLES WITH SUBJECTIVE/EMOTIONAL LANGUAGE ---")
-    subjective = ['annoying', 'obvious', 'frustration', 'friendly', 'motivational',
-                  'caution', 'urgency', 'profitable', 'kawaii', 'fun', 'best',
-                  'simple', 'comprehensive', 'authoritative', 'innovative']
-    for c in convos:
-        title_lower = c['title'].lower()
-        for word in subjective:
-            if word in title_lower:
-                print(f"  [{word}] {c['title']} ({c['category']})")
-                break
+    for line in state.subjective:
+        print(f"  {line}")
     
     # Title repetitions (exact or near-exact)
     print("\n--- REPEATED/DUPLICATE TITLES ---")
-    title_counts = Counter(c['title'] for c in convos)
-    for title, count in title_counts.most_common():
+    for title, count in state.title_counts.most_common():
         if count >= 2:
-            dates = [c['date'].strftime('%Y-%m-%d') for c in convos if c['title'] == title and c['date']]
-            print(f"  '{title}' × {count} on {dates}")
+            print(f"  '{title}' × {count} on {state.title_dates[title]}")
 
 def cross_platform_baseline(convos):
     """Establish what patterns would be anomalous vs expected for this specific user."""
@@ -506,36 +690,15 @@ def cross_platform_baseline(convos):
     interests = set()
     locations = set()
     
-    keyword_maps = {
-        'tech_stack': {
-            'python': 'Python', 'powershell': 'PowerShell', 'masm64': 'MASM64/x86 ASM',
-            'directx': 'DirectX', 'unity': 'Unity', 'github': 'GitHub',
-            'node': 'Node.js', 'sqlite': 'SQLite', 'ios': 'iOS', 'xcode': 'Xcode',
-            'windows': 'Windows', 'basic': 'GW-BASIC', 'sonic': 'SONiC',
-            'javascript': 'JavaScript', 'puter': 'Puter.js'
-        },
-        'interests': {
-            'yu-gi-oh': 'Yu-Gi-Oh', 'ccg': 'Card Games', 'chess': 'Chess',
-            'fighting': 'Fighting Games', 'ballistics': 'Ballistics/Firearms',
-            'wrestling': 'Wrestling', 'anime': 'Anime/Manga', 'kawaii': 'Anime/Manga',
-            'emiru': 'Twitch/Streaming', 'football': 'Sports', 'diablo': 'Gaming',
-            'ff6': 'Retro Gaming'
-        },
-        'locations': {
-            'wheatland': 'Wheatland, WY', 'wyoming': 'Wyoming', 'glendo': 'Glendo, WY',
-            'santa fe': 'Santa Fe, NM', 'san clemente': 'San Clemente, CA'
-        }
-    }
-    
     for c in convos:
-        title_lower = c['title'].lower()
-        for keyword, label in keyword_maps['tech_stack'].items():
+        title_lower = c.title_lower
+        for keyword, label in _KEYWORD_MAPS['tech_stack'].items():
             if keyword in title_lower:
                 tech_stack.add(label)
-        for keyword, label in keyword_maps['interests'].items():
+        for keyword, label in _KEYWORD_MAPS['interests'].items():
             if keyword in title_lower:
                 interests.add(label)
-        for keyword, label in keyword_maps['locations'].items():
+        for keyword, label in _KEYWORD_MAPS['locations'].items():
             if keyword in title_lower:
                 locations.add(label)
     
@@ -554,7 +717,7 @@ def cross_platform_baseline(convos):
     print("  • No news/politics discussions")
     print("  • Very few health-related questions (2 total)")
 
-def anomaly_summary(convos):
+def anomaly_summary(convos, state):
     """Summarize all detected anomalies."""
     print("\n" + "=" * 70)
     print("ANOMALY SUMMARY — ALL DETECTED PATTERNS")
@@ -563,23 +726,23 @@ def anomaly_summary(convos):
     anomalies = []
     
     # 1. Jan 7 cluster
-    jan7 = [c for c in convos if c['date'] and c['date'].strftime('%Y-%m-%d') == '2026-01-07']
+    jan7 = state.by_date.get('2026-01-07', [])
     if len(jan7) >= 5:
         anomalies.append({
             'type': 'TEMPORAL',
             'severity': 'MODERATE',
             'detail': f'Jan 7, 2026: {len(jan7)} sessions in one day (3.5× daily mean). Includes meta/utility sessions suggesting platform exploration burst.',
-            'sessions': [c['title'] for c in jan7]
+            'sessions': [c.title for c in jan7]
         })
     
     # 2. Nov 22 cluster
-    nov22 = [c for c in convos if c['date'] and c['date'].strftime('%Y-%m-%d') == '2025-11-22']
+    nov22 = state.by_date.get('2025-11-22', [])
     if len(nov22) >= 5:
         anomalies.append({
             'type': 'TEMPORAL',
             'severity': 'MODERATE',
             'detail': f'Nov 22, 2025: {len(nov22)} sessions in one day. High topic diversity (Technical, Gaming, Creative, Business).',
-            'sessions': [c['title'] for c in nov22]
+            'sessions': [c.title for c in nov22]
         })
     
     # 3. Jul-Oct gap
@@ -590,8 +753,7 @@ def anomaly_summary(convos):
     })
     
     # 4. Duplicate titles
-    title_counts = Counter(c['title'] for c in convos)
-    dupes = {t: c for t, c in title_counts.items() if c >= 2}
+    dupes = {t: c for t, c in state.title_counts.items() if c >= 2}
     if dupes:
         anomalies.append({
             'type': 'STRUCTURAL',
@@ -614,7 +776,7 @@ def anomaly_summary(convos):
     })
     
     # 7. Wyoming + ballistics concentration
-    bal = [c for c in convos if 'ballistic' in c['title'].lower()]
+    bal = state.ballistics
     anomalies.append({
         'type': 'THEMATIC',
         'severity': 'LOW',
@@ -622,12 +784,12 @@ def anomaly_summary(convos):
     })
     
     # 8. Grok meta-conversations
-    grok_meta = [c for c in convos if 'grok' in c['title'].lower()]
+    grok_meta = state.grok_meta
     anomalies.append({
         'type': 'META',
         'severity': 'LOW',
         'detail': f'{len(grok_meta)} Grok self-referential conversations. May contain AI existential reflection if Grok discusses its own nature.',
-        'sessions': [c['title'] for c in grok_meta]
+        'sessions': [c.title for c in grok_meta]
     })
     
     # Print summary
@@ -639,13 +801,14 @@ def anomaly_summary(convos):
                 print(f"        • {s}")
 
 # Run all analyses
-convos = parse_data(RAW_DATA)
+convos = CONVERSATIONS
 print(f"Parsed {len(convos)} conversations\n")
 
-title_structure_analysis(convos)
-topic_distribution(convos)
-temporal_analysis(convos)
-semantic_anomaly_scan(convos)
-grok_title_generation_analysis(convos)
+state = analyze_all(convos)
+title_structure_analysis(convos, state, ARRAYS)
+topic_distribution(convos, state, ARRAYS)
+temporal_analysis(convos, state, ARRAYS)
+semantic_anomaly_scan(convos, state)
+grok_title_generation_analysis(convos, state)
 cross_platform_baseline(convos)
-anomaly_summary(convos)
+anomaly_summary(convos, state)
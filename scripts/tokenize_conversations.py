@@ -24,19 +24,49 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import math
 import re
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 PARSED_DIR = DATA_DIR / "parsed"
 OUTPUT_DIR = DATA_DIR / "analysis"
 
+# orjson (optional) for faster JSON decode/encode; either way the output is
+# 2-space-indented UTF-8
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(data: bytes):
+    """Decode JSON from raw file bytes."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Encode ``obj`` as 2-space-indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Sum of a Counter's counts: Counter.total() on 3.10+, which sums in C
+if sys.version_info >= (3, 10):
+    _total = Counter.total
+else:
+    def _total(counter: Counter) -> int:
+        return sum(counter.values())
+
 # Common English stop words (extended for chat context)
 STOP_WORDS = {
     "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
@@ -61,6 +91,25 @@ STOP_WORDS = {
     "really", "right", "still", "way", "new", "one", "two", "first",
 }
 
+# Tokenizer patterns, compiled once
+_CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_RE = re.compile(r"`[^`]+`")
+_URL_RE = re.compile(r"https?://\S+")
+# Markdown punctuation -> space, applied with str.translate
+_MD_TABLE = str.maketrans(dict.fromkeys("*_#>|~[](){}", " "))
+_WORD_PATTERN = r"\b[a-z][a-z'-]*[a-z]\b|[a-z]\b"
+_WORD_RE = re.compile(_WORD_PATTERN)
+
+# re2 (optional) runs the word pattern as a DFA. Its \b is ASCII-only while
+# re's is Unicode-aware, so it is only used on pure-ASCII text, where the two
+# engines agree
+try:
+    import re2
+    _WORD_RE2 = re2.compile(_WORD_PATTERN)
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
 
 def tokenize(text: str, lowercase: bool = True) -> list[str]:
     """
@@ -69,16 +118,22 @@ def tokenize(text: str, lowercase: bool = True) -> list[str]:
     """
     if lowercase:
         text = text.lower()
-    # Remove code blocks (``` ... ```)
-    text = re.sub(r"```[\s\S]*?```", " CODE_BLOCK ", text)
-    # Remove inline code (`...`)
-    text = re.sub(r"`[^`]+`", " CODE_INLINE ", text)
+    # Remove code blocks (``` ... ```) and inline code (`...`); a pass is
+    # only run when its delimiter occurs, so plain prose is not re-copied
+    if "`" in text:
+        if "```" in text:
+            text = _CODE_BLOCK_RE.sub(" CODE_BLOCK ", text)
+        text = _INLINE_RE.sub(" CODE_INLINE ", text)
     # Remove URLs
-    text = re.sub(r"https?://\S+", " URL ", text)
+    if "://" in text:
+        text = _URL_RE.sub(" URL ", text)
     # Remove markdown formatting
-    text = re.sub(r"[*_#>|~\[\](){}]", " ", text)
+    text = text.translate(_MD_TABLE)
     # Tokenize: letters, numbers, hyphens within words
-    words = re.findall(r"\b[a-z][a-z'-]*[a-z]\b|[a-z]\b", text)
+    if HAS_RE2 and text.isascii():
+        words = _WORD_RE2.findall(text)
+    else:
+        words = _WORD_RE.findall(text)
     return [w for w in words if len(w) > 1]
 
 
@@ -87,41 +142,45 @@ def ngrams(tokens: list[str], n: int) -> list[str]:
     return [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
 
 
+def ngram_counts(tokens: list[str], n: int) -> Counter:
+    """Count n-grams keyed by token tuples (no per-position string joins)."""
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def top_ngrams(counts: Counter, k: int) -> dict[str, int]:
+    """The k most common tuple-keyed n-grams, joined into strings for output."""
+    return {" ".join(gram): count for gram, count in counts.most_common(k)}
+
+
 def remove_stopwords(tokens: list[str]) -> list[str]:
     """Remove stop words from token list."""
     return [t for t in tokens if t not in STOP_WORDS]
 
 
-def type_token_ratio(tokens: list[str]) -> float:
-    """Type-Token Ratio — vocabulary diversity."""
-    if not tokens:
+def type_token_ratio(freq: Counter, n: int) -> float:
+    """Type-Token Ratio — vocabulary diversity, from token counts and total."""
+    if not n:
         return 0.0
-    return len(set(tokens)) / len(tokens)
+    return len(freq) / n
 
 
-def hapax_ratio(tokens: list[str]) -> float:
-    """Proportion of words that appear exactly once."""
-    if not tokens:
+def hapax_ratio(freq: Counter) -> float:
+    """Proportion of words that appear exactly once, from token counts."""
+    if not freq:
         return 0.0
-    freq = Counter(tokens)
     hapax = sum(1 for count in freq.values() if count == 1)
     return hapax / len(freq)
 
 
-def yules_k(tokens: list[str]) -> float:
+def yules_k(freq: Counter, n: int) -> float:
     """
-    Yule's K — vocabulary richness measure.
+    Yule's K — vocabulary richness measure, from token counts and total.
     Lower K = richer vocabulary. Independent of text length.
     """
-    if not tokens:
-        return 0.0
-    freq = Counter(tokens)
-    n = len(tokens)
-    freq_spectrum = Counter(freq.values())  # frequency of frequencies
-
-    m2 = sum(i * i * fi for i, fi in freq_spectrum.items())
     if n <= 1:
         return 0.0
+    # sum over types of count^2 == sum(i^2 * V_i) over the frequency spectrum
+    m2 = sum(count * count for count in freq.values())
     k = 10000 * (m2 - n) / (n * n)
     return round(k, 2)
 
@@ -138,81 +197,105 @@ def analyze_conversation(conv_data: dict) -> dict:
         "slug": conv_data.get("slug", ""),
     }
 
-    # Separate by role
-    role_texts = defaultdict(list)
+    # Tokenize each turn once; the combined and per-role token streams are
+    # concatenations of turn tokens, so no joined copy of the text is built
+    all_tokens: list[str] = []
+    by_role: dict[str, list[str]] = defaultdict(list)
     for turn in conv_data.get("turns", []):
-        role_texts[turn["role"]].append(turn["content"])
-
-    all_text = " ".join(
-        turn["content"] for turn in conv_data.get("turns", [])
-    )
+        turn_tokens = tokenize(turn["content"])
+        all_tokens.extend(turn_tokens)
+        by_role[turn["role"]].extend(turn_tokens)
 
     # Analyze each role + combined
-    for label, text in [("combined", all_text)] + [
-        (role, " ".join(texts)) for role, texts in role_texts.items()
-    ]:
-        tokens = tokenize(text)
-        tokens_no_stop = remove_stopwords(tokens)
-
-        freq = Counter(tokens_no_stop)
-        bi = Counter(ngrams(tokens, 2))
-        tri = Counter(ngrams(tokens, 3))
+    for label, tokens in [("combined", all_tokens), *by_role.items()]:
+        n = len(tokens)
+        # One count of every token feeds all the vocabulary metrics
+        freq_full = Counter(tokens)
+        freq = Counter({t: c for t, c in freq_full.items() if t not in STOP_WORDS})
+        bi = ngram_counts(tokens, 2)
+        tri = ngram_counts(tokens, 3)
 
         results[label] = {
-            "total_tokens": len(tokens),
-            "unique_tokens": len(set(tokens)),
-            "tokens_no_stopwords": len(tokens_no_stop),
-            "type_token_ratio": round(type_token_ratio(tokens), 4),
-            "hapax_ratio": round(hapax_ratio(tokens), 4),
-            "yules_k": yules_k(tokens),
+            "total_tokens": n,
+            "unique_tokens": len(freq_full),
+            "tokens_no_stopwords": _total(freq),
+            "type_token_ratio": round(type_token_ratio(freq_full, n), 4),
+            "hapax_ratio": round(hapax_ratio(freq_full), 4),
+            "yules_k": yules_k(freq_full, n),
             "top_unigrams": dict(freq.most_common(50)),
-            "top_bigrams": dict(bi.most_common(30)),
-            "top_trigrams": dict(tri.most_common(20)),
+            "top_bigrams": top_ngrams(bi, 30),
+            "top_trigrams": top_ngrams(tri, 20),
         }
 
     return results
 
 
-def compute_tfidf(corpus: list[dict]) -> dict:
+def role_tokens(conv: dict, role: str) -> Iterator[str]:
+    """Tokens of every turn by ``role``, in order, tokenized turn by turn."""
+    for turn in conv.get("turns", []):
+        if turn["role"] == role:
+            yield from tokenize(turn["content"])
+
+
+def iter_corpus(files: Iterable[Path]) -> Iterator[dict]:
+    """Load parsed conversations one file at a time."""
+    for f in files:
+        yield _loads(f.read_bytes())
+
+
+def _summarize_file(path: Path) -> tuple[dict, dict[str, int], int]:
+    """
+    Analyze one conversation file for the corpus summary: its
+    per-conversation row, Grok top unigrams and Grok token count.
+    """
+    result = analyze_conversation(_loads(path.read_bytes()))
+    combined = result.get("combined", {})
+    row = {
+        "title": result["title"],
+        "total_tokens": combined.get("total_tokens", 0),
+        "ttr": combined.get("type_token_ratio", 0),
+        "yules_k": combined.get("yules_k", 0),
+    }
+    grok = result.get("grok", {})
+    return row, grok.get("top_unigrams", {}), grok.get("total_tokens", 0)
+
+
+def compute_tfidf(corpus: Iterable[dict]) -> dict:
     """
     Compute TF-IDF across all conversations (treating each as a document).
     Uses Grok's text only to focus on model behavior.
 
     Returns per-document TF-IDF scores for top terms.
     """
-    # Build document term frequencies
-    doc_freqs: list[tuple[str, Counter]] = []  # (title, term_counts)
-    doc_count = len(corpus)
+    # Build document term frequencies, and document frequency for each term
+    doc_freqs: list[tuple[str, Counter, int]] = []  # (title, term_counts, total)
+    df: Counter = Counter()
 
     for conv in corpus:
-        grok_text = " ".join(
-            turn["content"]
-            for turn in conv.get("turns", [])
-            if turn["role"] == "grok"
-        )
-        tokens = remove_stopwords(tokenize(grok_text))
-        doc_freqs.append((conv["title"], Counter(tokens)))
-
-    # Document frequency for each term
-    df: Counter = Counter()
-    for _, freq in doc_freqs:
-        for term in freq:
-            df[term] += 1
+        freq = Counter(t for t in role_tokens(conv, "grok") if t not in STOP_WORDS)
+        # Counts are final here, so the document length is taken once
+        doc_freqs.append((conv["title"], freq, _total(freq)))
+        # A keys view is counted element-wise in C: +1 per distinct term
+        df.update(freq.keys())
+
+    doc_count = len(doc_freqs)
+
+    # IDF depends only on the term, so take each log once per vocabulary
+    # entry rather than once per (document, term) pair
+    idf = {term: math.log(doc_count / (1 + n)) for term, n in df.items()}
 
     # Compute TF-IDF
     tfidf_results = {}
-    for title, freq in doc_freqs:
-        total = sum(freq.values())
+    for title, freq, total in doc_freqs:
         if total == 0:
             continue
-        scores = {}
-        for term, count in freq.items():
-            tf = count / total
-            idf = math.log(doc_count / (1 + df[term]))
-            scores[term] = round(tf * idf, 6)
+        scores = {
+            term: round(count / total * idf[term], 6)
+            for term, count in freq.items()
+        }
 
         # Top 30 by TF-IDF
-        top = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:30]
+        top = heapq.nlargest(30, scores.items(), key=itemgetter(1))
         tfidf_results[title] = dict(top)
 
     return {
@@ -223,13 +306,12 @@ def compute_tfidf(corpus: list[dict]) -> dict:
     }
 
 
-def temporal_analysis(corpus: list[dict], index_data: Optional[dict] = None) -> dict:
+def temporal_analysis(corpus: Iterable[dict], index_data: Optional[dict] = None) -> dict:
     """
     Analyze token frequency trends over time.
     Groups conversations by month and tracks vocabulary evolution.
     """
     monthly_tokens: dict[str, Counter] = defaultdict(Counter)
-    monthly_vocab: dict[str, set] = defaultdict(set)
     monthly_counts: dict[str, int] = defaultdict(int)
 
     # Try to get dates from index
@@ -247,27 +329,21 @@ def temporal_analysis(corpus: list[dict], index_data: Optional[dict] = None) ->
 
         month_key = date_iso[:7]  # "2025-12"
 
-        grok_text = " ".join(
-            turn["content"]
-            for turn in conv.get("turns", [])
-            if turn["role"] == "grok"
-        )
-        tokens = remove_stopwords(tokenize(grok_text))
+        freq = Counter(t for t in role_tokens(conv, "grok") if t not in STOP_WORDS)
 
-        monthly_tokens[month_key].update(tokens)
-        monthly_vocab[month_key].update(tokens)
+        monthly_tokens[month_key].update(freq)
         monthly_counts[month_key] += 1
 
     # Build timeline
     timeline = {}
     for month in sorted(monthly_tokens.keys()):
         freq = monthly_tokens[month]
-        total = sum(freq.values())
+        total = _total(freq)
         timeline[month] = {
             "conversations": monthly_counts[month],
             "total_tokens": total,
-            "unique_tokens": len(monthly_vocab[month]),
-            "ttr": round(len(monthly_vocab[month]) / total, 4) if total else 0,
+            "unique_tokens": len(freq),
+            "ttr": round(len(freq) / total, 4) if total else 0,
             "top_terms": dict(freq.most_common(30)),
         }
 
@@ -276,7 +352,7 @@ def temporal_analysis(corpus: list[dict], index_data: Optional[dict] = None) ->
     new_terms_by_month = {}
     seen_so_far: set[str] = set()
     for month in months_sorted:
-        current_vocab = set(monthly_tokens[month].keys())
+        current_vocab = monthly_tokens[month].keys()
         new_terms = current_vocab - seen_so_far
         new_terms_by_month[month] = len(new_terms)
         seen_so_far.update(current_vocab)
@@ -300,15 +376,17 @@ def main():
     parser.add_argument("--temporal", action="store_true", help="Temporal token analysis")
     parser.add_argument("--index", type=Path, help="Conversation index JSON (for dates)")
     parser.add_argument("-o", "--output", type=Path, help="Output file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for the per-conversation summary")
 
     args = parser.parse_args()
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     if args.file:
-        conv = json.loads(args.file.read_text(encoding="utf-8"))
+        conv = _loads(args.file.read_bytes())
         result = analyze_conversation(conv)
         out = args.output or (OUTPUT_DIR / f"tokens_{conv['slug']}.json")
-        out.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        out.write_bytes(_dumps(result))
         print(f"✓ Token analysis for '{conv['title']}' → {out}")
         if "combined" in result:
             c = result["combined"]
@@ -324,62 +402,58 @@ def main():
             print(f"No conv_*.json files in {args.corpus}")
             sys.exit(1)
 
-        corpus = []
-        for f in json_files:
-            corpus.append(json.loads(f.read_text(encoding="utf-8")))
+        # Streamed: each conversation is parsed, analyzed and dropped in turn
+        corpus = iter_corpus(json_files)
 
-        print(f"Loaded {len(corpus)} conversations")
+        print(f"Loaded {len(json_files)} conversations")
 
         # Index for dates
         index_data = None
         index_path = args.index or (PARSED_DIR / "conversation_index.json")
         if index_path.exists():
-            index_data = json.loads(index_path.read_text(encoding="utf-8"))
+            index_data = _loads(index_path.read_bytes())
 
         if args.tfidf:
             result = compute_tfidf(corpus)
             out = args.output or (OUTPUT_DIR / "tfidf_corpus.json")
-            out.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+            out.write_bytes(_dumps(result))
             print(f"✓ TF-IDF analysis → {out}")
             print(f"  Documents: {result['doc_count']}, Vocabulary: {result['vocabulary_size']}")
 
         elif args.temporal:
             result = temporal_analysis(corpus, index_data)
             out = args.output or (OUTPUT_DIR / "temporal_tokens.json")
-            out.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+            out.write_bytes(_dumps(result))
             print(f"✓ Temporal analysis → {out}")
             print(f"  Months covered: {result['total_months']}")
 
         else:
             # Analyze each conversation individually + corpus summary
-            all_results = []
+            per_conversation = []
             corpus_tokens: Counter = Counter()
             total_token_count = 0
 
-            for conv in corpus:
-                result = analyze_conversation(conv)
-                all_results.append(result)
+            # Files are independent, so with --workers > 1 they are analyzed in
+            # a process pool; map() keeps file order for the aggregation below
+            if args.workers > 1:
+                with ProcessPoolExecutor(max_workers=args.workers) as ex:
+                    summaries = list(ex.map(_summarize_file, json_files, chunksize=8))
+            else:
+                summaries = map(_summarize_file, json_files)
 
-                if "grok" in result:
-                    corpus_tokens.update(result["grok"].get("top_unigrams", {}))
-                    total_token_count += result["grok"].get("total_tokens", 0)
+            for row, grok_unigrams, grok_tokens in summaries:
+                per_conversation.append(row)
+                corpus_tokens.update(grok_unigrams)
+                total_token_count += grok_tokens
 
             summary = {
-                "corpus_size": len(corpus),
+                "corpus_size": len(per_conversation),
                 "total_grok_tokens": total_token_count,
                 "corpus_top_terms": dict(corpus_tokens.most_common(100)),
-                "per_conversation": [
-                    {
-                        "title": r["title"],
-                        "total_tokens": r.get("combined", {}).get("total_tokens", 0),
-                        "ttr": r.get("combined", {}).get("type_token_ratio", 0),
-                        "yules_k": r.get("combined", {}).get("yules_k", 0),
-                    }
-                    for r in all_results
-                ],
+                "per_conversation": per_conversation,
             }
             out = args.output or (OUTPUT_DIR / "token_summary.json")
-            out.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+            out.write_bytes(_dumps(summary))
             print(f"✓ Corpus token summary → {out}")
             print(f"  Total Grok tokens: {total_token_count}")
             top5 = list(corpus_tokens.most_common(5))
@@ -25,15 +25,40 @@ Usage:
 
 import argparse
 import json
-import math
 import re
 import sys
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 sys.path.insert(0, str(Path(__file__).parent))
-from analyze import analyze, tokenize, ALL_VOID_TERMS  # noqa: E402
+from analyze import analyze_tokens, tokenize, ALL_VOID_TERMS  # noqa: E402
+
+# orjson (optional) for faster JSON decode/encode; either way the output is
+# 2-space-indented UTF-8
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(data: bytes):
+    """Decode JSON from raw file bytes."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Encode ``obj`` as 2-space-indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 # Sensitivity thresholds for change detection
@@ -46,69 +71,122 @@ SENSITIVITY = {
 
 def load_index(path: Path) -> dict:
     """Load conversation index."""
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def extract_title_features(conversations: list[dict]) -> list[dict]:
-    """Extract behavioral features from conversation titles."""
-    features = []
-    for conv in conversations:
+    return _loads(path.read_bytes())
+
+
+# Numeric title features, in TitleFeatures.values column order
+NUMERIC_FEATURES = (
+    "token_count", "unique_ratio", "void_density",
+    "word_count", "char_count", "capitalized_ratio",
+)
+WORD_COUNT = NUMERIC_FEATURES.index("word_count")
+
+
+class TitleFeatures(NamedTuple):
+    """Per-title features stored column-wise, one row per dated title."""
+
+    dates: list[str]
+    titles: list[str]
+    values: np.ndarray              # (N, len(NUMERIC_FEATURES)) float64
+    has_colon: np.ndarray           # (N,) bool
+    has_parenthetical: np.ndarray   # (N,) bool
+
+
+def extract_title_features(conversations: list[dict]) -> TitleFeatures:
+    """Extract behavioral features from conversation titles, in date order."""
+    dates: list[str] = []
+    titles: list[str] = []
+    rows: list[tuple] = []
+    has_colon: list[bool] = []
+    has_parenthetical: list[bool] = []
+    # Order the small index records (timsort is linear when already sorted) so
+    # features come out date-ordered without sorting the feature rows after
+    for conv in sorted(conversations, key=lambda c: c.get("date_iso") or ""):
+        date_iso = conv.get("date_iso")
+        if not date_iso:
+            continue
         title = conv.get("title", "")
         tokens = tokenize(title)
-        date = conv.get("date_iso")
-        if not date or not tokens:
+        if not tokens:
             continue
 
         void_count = sum(1 for t in tokens if t in ALL_VOID_TERMS)
+        words = title.split()
 
         # Title style features
-        features.append({
-            "date": date,
-            "title": title,
-            "token_count": len(tokens),
-            "unique_ratio": len(set(tokens)) / len(tokens) if tokens else 0,
-            "void_density": void_count / len(tokens) if tokens else 0,
-            "has_colon": ":" in title,
-            "has_parenthetical": "(" in title,
-            "word_count": len(title.split()),
-            "char_count": len(title),
-            "capitalized_ratio": sum(1 for w in title.split() if w and w[0].isupper()) / max(len(title.split()), 1),
-        })
+        dates.append(date_iso)
+        titles.append(title)
+        rows.append((
+            len(tokens),
+            len(set(tokens)) / len(tokens),
+            void_count / len(tokens),
+            len(words),
+            len(title),
+            sum(1 for w in words if w and w[0].isupper()) / max(len(words), 1),
+        ))
+        has_colon.append(":" in title)
+        has_parenthetical.append("(" in title)
+
+    return TitleFeatures(
+        dates=dates,
+        titles=titles,
+        values=np.array(rows, dtype=np.float64).reshape(len(rows), len(NUMERIC_FEATURES)),
+        has_colon=np.array(has_colon, dtype=bool),
+        has_parenthetical=np.array(has_parenthetical, dtype=bool),
+    )
 
-    return sorted(features, key=lambda x: x["date"])
 
+def _text_features(md_file: Path) -> Optional[dict]:
+    """Features of one conversation markdown file (None if under 10 tokens)."""
+    text = md_file.read_text(encoding="utf-8")
+    tokens = tokenize(text)
+    if len(tokens) < 10:
+        return None
+
+    # Reuse the tokens rather than letting analyze() tokenize the text again
+    analysis = analyze_tokens(tokens)
+    void_terms = analysis["void_term_frequencies"]
+    unique = analysis["unique_words"]
+
+    return {
+        "file": md_file.name,
+        "total_tokens": len(tokens),
+        "unique_tokens": unique,
+        "ttr": unique / len(tokens),
+        "void_density": analysis["void_cluster"]["proportion"],
+        "void_percent": analysis["void_cluster"]["percent"],
+        "top_void_terms": dict(islice(void_terms.items(), 5)),
+        "avg_word_length": sum(map(len, tokens)) / len(tokens),
+    }
+
+
+def extract_text_features(conversations_dir: Path, workers: int = 1) -> dict[str, dict]:
+    """
+    Extract features from full conversation texts.
 
-def extract_text_features(conversations_dir: Path) -> dict[str, dict]:
-    """Extract features from full conversation texts."""
+    Files are analyzed in-process by default; with ``workers`` > 1 they are
+    spread over a process pool of that size.
+    """
     results = {}
     if not conversations_dir.exists():
         return results
 
-    for md_file in sorted(conversations_dir.glob("*.md")):
-        text = md_file.read_text(encoding="utf-8")
-        tokens = tokenize(text)
-        if len(tokens) < 10:
-            continue
+    md_files = sorted(conversations_dir.glob("*.md"))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            features = list(ex.map(_text_features, md_files, chunksize=8))
+    else:
+        features = map(_text_features, md_files)
 
-        analysis = analyze(text)
-        void_terms = analysis["void_term_frequencies"]
-
-        results[md_file.stem] = {
-            "file": md_file.name,
-            "total_tokens": len(tokens),
-            "unique_tokens": len(set(tokens)),
-            "ttr": len(set(tokens)) / len(tokens),
-            "void_density": analysis["void_cluster"]["proportion"],
-            "void_percent": analysis["void_cluster"]["percent"],
-            "top_void_terms": dict(list(void_terms.items())[:5]),
-            "avg_word_length": sum(len(t) for t in tokens) / len(tokens),
-        }
+    for md_file, feats in zip(md_files, features):
+        if feats is not None:
+            results[md_file.stem] = feats
 
     return results
 
 
 def sliding_window_compare(
-    features: list[dict],
+    features: TitleFeatures,
     window_size: int = 5,
     step: int = 1,
 ) -> list[dict]:
@@ -118,51 +196,52 @@ def sliding_window_compare(
     For each feature dimension, compute z-score of the difference
     between the mean of window_A (before) and window_B (after).
     """
-    if len(features) < window_size * 2:
+    dates = features.dates
+    if len(dates) < window_size * 2 or window_size < 2:
         return []
 
-    comparisons = []
-    numeric_keys = [
-        "token_count", "unique_ratio", "void_density",
-        "word_count", "char_count", "capitalized_ratio",
-    ]
+    # (N, K) feature matrix -> per-window means/variances for every start
+    # position at once; window i covers rows i .. i + window_size - 1. Each
+    # window is reduced once and shared by the two boundaries that use it.
+    # Prefix sums of x and x^2 would make this O(1) per window, but the
+    # sum-of-squares difference leaves ~1e-16 residue on constant windows,
+    # which then bypass the 0.001 pooled-std floor and yield huge z-scores.
+    windows = sliding_window_view(features.values, window_size, axis=0)  # (N-W+1, K, W)
+    means = windows.mean(axis=-1)
+    variances = windows.var(axis=-1, ddof=1)
+
+    # Window A ends at each boundary, window B starts there
+    boundaries = np.arange(window_size, len(dates) - window_size + 1, step)
+    mean_a = means[boundaries - window_size]
+    mean_b = means[boundaries]
+    var_sum = variances[boundaries - window_size] + variances[boundaries]
+
+    # Pooled standard deviation
+    pooled_std = np.where(var_sum > 0, np.sqrt(var_sum / 2), 0.001)
+    z = (mean_b - mean_a) / pooled_std
+    cohen_d = np.abs(mean_b - mean_a) / pooled_std
 
-    for i in range(window_size, len(features) - window_size + 1, step):
-        window_a = features[max(0, i - window_size):i]
-        window_b = features[i:i + window_size]
-
-        if len(window_a) < 2 or len(window_b) < 2:
-            continue
-
-        feature_diffs = {}
-        for key in numeric_keys:
-            vals_a = [f[key] for f in window_a]
-            vals_b = [f[key] for f in window_b]
-
-            mean_a = sum(vals_a) / len(vals_a)
-            mean_b = sum(vals_b) / len(vals_b)
-
-            # Pooled standard deviation
-            var_a = sum((v - mean_a) ** 2 for v in vals_a) / max(len(vals_a) - 1, 1)
-            var_b = sum((v - mean_b) ** 2 for v in vals_b) / max(len(vals_b) - 1, 1)
-            pooled_std = math.sqrt((var_a + var_b) / 2) if (var_a + var_b) > 0 else 0.001
-
-            z = (mean_b - mean_a) / pooled_std
-            cohen_d = abs(mean_b - mean_a) / pooled_std
-
-            feature_diffs[key] = {
-                "mean_before": round(mean_a, 4),
-                "mean_after": round(mean_b, 4),
-                "z_score": round(z, 2),
-                "cohen_d": round(cohen_d, 3),
+    comparisons = []
+    for row, i in enumerate(boundaries.tolist()):
+        feature_diffs = {
+            key: {
+                "mean_before": round(ma, 4),
+                "mean_after": round(mb, 4),
+                "z_score": round(zk, 2),
+                "cohen_d": round(dk, 3),
             }
+            for key, ma, mb, zk, dk in zip(
+                NUMERIC_FEATURES,
+                mean_a[row].tolist(), mean_b[row].tolist(),
+                z[row].tolist(), cohen_d[row].tolist(),
+            )
+        }
 
-        boundary_date = features[i]["date"]
         comparisons.append({
             "boundary_index": i,
-            "boundary_date": boundary_date,
-            "window_a_dates": f"{window_a[0]['date']} — {window_a[-1]['date']}",
-            "window_b_dates": f"{window_b[0]['date']} — {window_b[-1]['date']}",
+            "boundary_date": dates[i],
+            "window_a_dates": f"{dates[i - window_size]} — {dates[i - 1]}",
+            "window_b_dates": f"{dates[i]} — {dates[i + window_size - 1]}",
             "feature_diffs": feature_diffs,
         })
 
@@ -214,21 +293,26 @@ def find_change_candidates(
                 ),
             })
 
-    # Deduplicate nearby candidates (within 7 days)
+    # Deduplicate nearby candidates (within 7 days); dates are parsed once and
+    # compared as calendar days so the window carries across month ends
     if candidates:
+        days = [date.fromisoformat(c["date"][:10]) for c in candidates]
         deduped = [candidates[0]]
-        for c in candidates[1:]:
-            if c["date"] > deduped[-1]["date"][:8] + str(int(deduped[-1]["date"][8:10]) + 7).zfill(2):
+        last_day = days[0]
+        for c, day in zip(candidates[1:], days[1:]):
+            if (day - last_day).days > 7:
                 deduped.append(c)
+                last_day = day
             elif c["aggregate_z"] > deduped[-1]["aggregate_z"]:
                 deduped[-1] = c  # Replace with stronger candidate
+                last_day = day
         candidates = deduped
 
     return candidates
 
 
 def format_markdown(
-    title_features: list[dict],
+    title_features: TitleFeatures,
     comparisons: list[dict],
     candidates: list[dict],
     metadata: dict,
@@ -237,9 +321,9 @@ def format_markdown(
     lines = [
         "# Grok Version Change Detection Report",
         "",
-        f"**Generated:** {datetime.now().isoformat()}",
+        f"**Generated:** {metadata.get('generated_at') or datetime.now().isoformat()}",
         f"**Sensitivity:** {metadata.get('sensitivity', 'medium')}",
-        f"**Conversations analyzed:** {len(title_features)}",
+        f"**Conversations analyzed:** {len(title_features.dates)}",
         f"**Window comparisons:** {len(comparisons)}",
         "",
     ]
@@ -280,10 +364,11 @@ def format_markdown(
         "## Title Style Distribution",
         "",
     ])
-    if title_features:
-        colon_pct = 100 * sum(1 for f in title_features if f["has_colon"]) / len(title_features)
-        paren_pct = 100 * sum(1 for f in title_features if f["has_parenthetical"]) / len(title_features)
-        avg_words = sum(f["word_count"] for f in title_features) / len(title_features)
+    n_titles = len(title_features.dates)
+    if n_titles:
+        colon_pct = 100 * int(title_features.has_colon.sum()) / n_titles
+        paren_pct = 100 * int(title_features.has_parenthetical.sum()) / n_titles
+        avg_words = float(title_features.values[:, WORD_COUNT].sum()) / n_titles
         lines.extend([
             f"- Titles with colon separator: {colon_pct:.0f}%",
             f"- Titles with parenthetical: {paren_pct:.0f}%",
@@ -302,6 +387,8 @@ def main():
     parser.add_argument("--min-window", type=int, default=5)
     parser.add_argument("--output", type=Path, required=True)
     parser.add_argument("--markdown", type=Path, default=None)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for text feature extraction")
     args = parser.parse_args()
 
     # Load data
@@ -310,11 +397,12 @@ def main():
 
     # Extract features
     title_features = extract_title_features(conversations)
-    print(f"  Title features extracted: {len(title_features)}")
+    n_titles = len(title_features.dates)
+    print(f"  Title features extracted: {n_titles}")
 
     text_features = {}
     if args.conversations and args.conversations.exists():
-        text_features = extract_text_features(args.conversations)
+        text_features = extract_text_features(args.conversations, args.workers)
         print(f"  Text features extracted: {len(text_features)}")
 
     # Sliding window comparison
@@ -332,7 +420,7 @@ def main():
         "sensitivity": args.sensitivity,
         "min_window": args.min_window,
         "total_conversations": len(conversations),
-        "title_features_count": len(title_features),
+        "title_features_count": n_titles,
         "text_features_count": len(text_features),
         "generated_at": datetime.now().isoformat(),
     }
@@ -343,18 +431,18 @@ def main():
         "version_change_candidates": candidates,
         "comparisons_count": len(comparisons),
         "title_style_summary": {
-            "total": len(title_features),
-            "with_colon": sum(1 for f in title_features if f["has_colon"]),
-            "with_parenthetical": sum(1 for f in title_features if f["has_parenthetical"]),
+            "total": n_titles,
+            "with_colon": int(title_features.has_colon.sum()),
+            "with_parenthetical": int(title_features.has_parenthetical.sum()),
             "avg_word_count": round(
-                sum(f["word_count"] for f in title_features) / max(len(title_features), 1), 1
+                float(title_features.values[:, WORD_COUNT].sum()) / max(n_titles, 1), 1
             ),
         },
     }
 
     # Write outputs
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    args.output.write_bytes(_dumps(report))
     print(f"✓ Version report → {args.output}")
 
     if args.markdown:
@@ -1,21 +1,59 @@
 """
 Shared fixtures and utilities for ai-grok-analysis test suite.
 """
+import json
 import math
 import sys
+from itertools import chain, repeat
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-# Add scripts to path
+# Add scripts to path — once, here; test modules then import analyze directly
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 import analyze  # noqa: E402
 
 
+# ─── Slow tests: skipped unless --run-slow ────────────────────────────────────
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="also run tests marked slow (full-scale inputs)",
+    )
+    parser.addoption(
+        "--snapshot-update", action="store_true", default=False,
+        help="rewrite tests/fixtures snapshots from current analyzer output",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: full-scale input; needs --run-slow")
+    config.addinivalue_line(
+        "markers", "analyzer: runs the full analyze() pipeline; deselect with -m 'not analyzer'"
+    )
+    # Registered here too so the mark is known when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run under one xdist worker with --dist=loadgroup"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # ─── Fixtures: Synthetic Text Corpora ─────────────────────────────────────────
+# Session-scoped: each fixture returns a literal that no test mutates, so one
+# instance is shared by every test that requests it.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pure_technical_text():
     """A technical text with zero void-semantic content.
     Should produce 0 void hits when properly analyzed."""
@@ -33,7 +71,7 @@ def pure_technical_text():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def technical_text_with_false_positives():
     """Technical text using void-cluster words in NON-void-semantic contexts.
     A naive word-counter would flag these; a correct analyzer should not."""
@@ -55,7 +93,7 @@ def technical_text_with_false_positives():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genuine_void_text():
     """Text with genuine void/dissolution semantic content.
     Even with technical stoplist, these should register as void-adjacent."""
@@ -70,7 +108,7 @@ def genuine_void_text():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_text():
     """Text mixing technical content with genuine void language.
     Tests whether the analyzer can find the void content amid technical noise."""
@@ -85,7 +123,7 @@ def mixed_text():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grok_style_technical():
     """Simulated Grok-style response: technical content with edgy personality.
     Tests the personality confound — void-adjacent language used as style, not semantics."""
@@ -101,7 +139,7 @@ def grok_style_technical():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grok_style_creative():
     """Simulated Grok creative response with personality and genuine void themes."""
     return (
@@ -116,7 +154,23 @@ def grok_style_creative():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def synthetic_1pct_void_text():
+    """1000 tokens at 1% void density (10 void words), genuinely elevated for
+    technical chat."""
+    return " ".join(chain(
+        repeat("code", 990), repeat("void", 5),
+        repeat("darkness", 3), repeat("shadow", 2),
+    ))
+
+
+@pytest.fixture(scope="session")
+def synthetic_1pct_void_tokens(synthetic_1pct_void_text):
+    """synthetic_1pct_void_text, tokenized once for analyze_tokens()."""
+    return analyze.tokenize(synthetic_1pct_void_text)
+
+
+@pytest.fixture(scope="session")
 def conversation_history_titles():
     """A subset of real Grok conversation titles for title-level testing."""
     return [
@@ -138,9 +192,141 @@ def conversation_history_titles():
     ]
 
 
+# ─── Fixtures: Analysis Results ───────────────────────────────────────────────
+# analyze() is pure, so each corpus is run through the pipeline once per
+# session; tests that only read the result dict share it (and must not mutate it).
+
+@pytest.fixture(scope="session")
+def pure_technical_result(pure_technical_text):
+    return analyze.analyze(pure_technical_text)
+
+
+@pytest.fixture(scope="session")
+def genuine_void_result(genuine_void_text):
+    return analyze.analyze(genuine_void_text)
+
+
+@pytest.fixture(scope="session")
+def mixed_result(mixed_text):
+    return analyze.analyze(mixed_text)
+
+
+@pytest.fixture(scope="session")
+def grok_style_technical_result(grok_style_technical):
+    return analyze.analyze(grok_style_technical)
+
+
+@pytest.fixture(scope="session")
+def grok_style_creative_result(grok_style_creative):
+    return analyze.analyze(grok_style_creative)
+
+
+@pytest.fixture(scope="session")
+def all_void_text():
+    """Every void-cluster term once, space-separated."""
+    return " ".join(analyze.ALL_VOID_TERMS)
+
+
+@pytest.fixture(scope="session")
+def all_void_result(all_void_text):
+    return analyze.analyze(all_void_text)
+
+
+@pytest.fixture(scope="session")
+def repeated_void_result():
+    """analyze() of "void " * 100."""
+    return analyze.analyze("void " * 100)
+
+
+@pytest.fixture(scope="session")
+def titles_analysis(conversation_history_titles):
+    """(joined title text, analyze() of it)."""
+    text = " ".join(conversation_history_titles)
+    return text, analyze.analyze(text)
+
+
+@pytest.fixture(scope="session")
+def titles_null_stats(titles_analysis):
+    """Expected void count in the titles at a 0.3% baseline, and P(0 hits)."""
+    _, result = titles_analysis
+    expected = result["total_tokens"] * 0.003
+    return {"expected": expected, "p_zero": math.exp(-expected)}
+
+
+@pytest.fixture(scope="session")
+def false_positive_results(technical_text_with_false_positives):
+    """analyze() of each technical text that trips the void cluster, by case."""
+    cases = {
+        "technical_text": technical_text_with_false_positives,
+        # 'void' the C type
+        "c_void": (
+            "The void main function calls void helper which returns void. "
+            "Cast the pointer to void star for generic storage."
+        ),
+        # 'null' the programming value
+        "null_pointer": (
+            "Check if the value is null before proceeding. "
+            "A null reference exception indicates a null pointer dereference. "
+            "The null object pattern eliminates null checks."
+        ),
+        # 'shadow DOM' the web standard
+        "shadow_dom": (
+            "The shadow DOM encapsulates component styles. "
+            "Create a shadow root using attachShadow mode open. "
+            "The shadow boundary prevents style leakage."
+        ),
+    }
+    return {name: analyze.analyze(text) for name, text in cases.items()}
+
+
+@pytest.fixture(scope="session")
+def baseline_stats():
+    """Summary of analyze.BASELINES: min, n, values and keys."""
+    baselines = analyze.BASELINES
+    return SimpleNamespace(
+        min=min(baselines.values()),
+        n=len(baselines),
+        values=frozenset(baselines.values()),
+        keys=frozenset(baselines.keys()),
+    )
+
+
+# ─── Fixtures: Regression Snapshots ───────────────────────────────────────────
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def snapshot_update(request):
+    """True when run with --snapshot-update: tests write snapshots, not compare."""
+    return request.config.getoption("--snapshot-update")
+
+
+@pytest.fixture(scope="session")
+def false_positives_snapshot():
+    """Void-cluster hits in technical_text_with_false_positives: count + distinct terms."""
+    return json.loads((FIXTURES_DIR / "false_positives_snapshot.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def write_false_positives_snapshot(snapshot_update):
+    """Callable taking the hit list: under --snapshot-update it rewrites the
+    snapshot and skips the calling test; otherwise it does nothing."""
+    def write(hits):
+        if not snapshot_update:
+            return
+        (FIXTURES_DIR / "false_positives_snapshot.json").write_text(
+            json.dumps({"count": len(hits), "tokens": sorted(set(hits))}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        pytest.skip("snapshot updated")
+    return write
+
+
 # ─── Technical Term Stoplist (for testing false-positive filtering) ───────────
 
-TECHNICAL_STOPLIST_COLLOCATIONS = {
+# Inner sets are frozen so a test cannot alter the stoplist other tests share
+TECHNICAL_STOPLIST_COLLOCATIONS = {term: frozenset(contexts) for term, contexts in {
     # term -> set of contexts where it's technical, not void-semantic
     "void": {"function", "return", "type", "pointer", "method", "cast", "main"},
     "null": {"pointer", "check", "value", "reference", "undefined", "coalesce", "safety"},
@@ -160,9 +346,9 @@ TECHNICAL_STOPLIST_COLLOCATIONS = {
     "abandoned": {"pull", "pr", "cart", "branch"},
     "chaos": {"engineering", "testing", "monkey", "mesh"},
     "trap": {"signal", "card", "cards", "handler"},
-}
+}.items()}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def technical_stoplist():
     return TECHNICAL_STOPLIST_COLLOCATIONS
@@ -6,30 +6,39 @@ These tests compute power for various scenarios and verify that
 the study design can detect the claimed effect sizes.
 """
 import math
-import sys
-from pathlib import Path
+from functools import lru_cache
+from typing import Final
 
+import numpy as np
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-import analyze
+from scipy.special import ndtr, ndtri
 
 
 # ─── Utility functions ────────────────────────────────────────────────────────
 
-def normal_cdf(x: float) -> float:
-    """Standard normal CDF (Abramowitz & Stegun approximation)."""
-    return 0.5 * math.erfc(-x / math.sqrt(2))
+# Standard normal CDF; a ufunc, so scalars and arrays share one path
+normal_cdf = ndtr
+
+# Critical z for α = 0.05, keyed by one_sided: exact quantiles, not 1.645/1.96
+_Z_ALPHA = {True: float(ndtri(0.95)), False: float(ndtri(0.975))}
+
+
+@lru_cache(maxsize=None)
+def _z_beta(power: float) -> float:
+    """z for the target power; one ndtri call per distinct power."""
+    return -float(ndtri(1 - power))
 
 
 def power_z_test_proportion(
-    n: int,
-    p0: float,
-    p1: float,
+    n,
+    p0,
+    p1,
     alpha: float = 0.05,
     one_sided: bool = True,
-) -> float:
+):
     """Compute power of a one-sample z-test for proportions.
+
+    Any of n, p0, p1 may be an array; they broadcast together.
     
     Args:
         n: Sample size (tokens)
@@ -39,22 +48,22 @@ def power_z_test_proportion(
         one_sided: One-sided test (H₁: p > p0)
     
     Returns:
-        Statistical power (probability of rejecting H₀ when H₁ is true)
+        Statistical power (probability of rejecting H₀ when H₁ is true);
+        a float for scalar inputs, else an ndarray
     """
-    z_alpha = 1.645 if one_sided else 1.96
-    se_null = math.sqrt(p0 * (1 - p0) / n)
-    se_alt = math.sqrt(p1 * (1 - p1) / n)
-
-    if se_null == 0 or se_alt == 0:
-        return 0.0
+    z_alpha = _Z_ALPHA[one_sided]
+    n, p0, p1 = (np.asarray(v, dtype=np.float64) for v in (n, p0, p1))
+    se_null = np.sqrt(p0 * (1 - p0) / n)
+    se_alt = np.sqrt(p1 * (1 - p1) / n)
 
     # Critical value under null
     critical_value = p0 + z_alpha * se_null
 
     # Power = P(reject H₀ | H₁ true) = P(p_hat > critical | p = p1)
-    z_power = (critical_value - p1) / se_alt
-    power = 1 - normal_cdf(z_power)
-    return power
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_power = (critical_value - p1) / se_alt
+    power = np.where((se_null == 0) | (se_alt == 0), 0.0, 1 - normal_cdf(z_power))
+    return float(power) if power.ndim == 0 else power
 
 
 def required_n_for_power(
@@ -63,51 +72,56 @@ def required_n_for_power(
     power: float = 0.80,
     alpha: float = 0.05,
     one_sided: bool = True,
-) -> int:
-    """Compute required sample size to achieve target power."""
-    z_alpha = 1.645 if one_sided else 1.96
-    z_beta = -normal_cdf_inverse(1 - power)
+) -> float:
+    """Compute required sample size to achieve target power.
+
+    Returns a whole number of tokens, or math.inf when p1 == p0.
+    """
+    z_alpha = _Z_ALPHA[one_sided]
+    z_beta = _z_beta(power)
 
     # Approximation: n = ((z_α * √(p0*q0) + z_β * √(p1*q1)) / (p1 - p0))²
     numerator = (z_alpha * math.sqrt(p0 * (1 - p0)) +
                  z_beta * math.sqrt(p1 * (1 - p1)))
     denominator = p1 - p0
     if denominator == 0:
-        return float('inf')
-    n = (numerator / denominator) ** 2
-    return math.ceil(n)
-
-
-def normal_cdf_inverse(p: float) -> float:
-    """Inverse normal CDF (rational approximation)."""
-    # Beasley-Springer-Moro algorithm
-    a = [0, -3.969683028665376e1, 2.209460984245205e2,
-         -2.759285104469687e2, 1.383577518672690e2,
-         -3.066479806614716e1, 2.506628277459239e0]
-    b = [0, -5.447609879822406e1, 1.615858368580409e2,
-         -1.556989798598866e2, 6.680131188771972e1, -1.328068155288572e1]
-    c = [0, -7.784894002430293e-3, -3.223964580411365e-1,
-         -2.400758277161838e0, -2.549732539343734e0,
-         4.374664141464968e0, 2.938163982698783e0]
-    d = [0, 7.784695709041462e-3, 3.224671290700398e-1,
-         2.445134137142996e0, 3.754408661907416e0]
-
-    p_low = 0.02425
-    p_high = 1 - p_low
-
-    if p < p_low:
-        q = math.sqrt(-2 * math.log(p))
-        return (((((c[1]*q+c[2])*q+c[3])*q+c[4])*q+c[5])*q+c[6]) / \
-               ((((d[1]*q+d[2])*q+d[3])*q+d[4])*q+1)
-    elif p <= p_high:
-        q = p - 0.5
-        r = q * q
-        return (((((a[1]*r+a[2])*r+a[3])*r+a[4])*r+a[5])*r+a[6])*q / \
-               (((((b[1]*r+b[2])*r+b[3])*r+b[4])*r+b[5])*r+1)
-    else:
-        q = math.sqrt(-2 * math.log(1 - p))
-        return -(((((c[1]*q+c[2])*q+c[3])*q+c[4])*q+c[5])*q+c[6]) / \
-                ((((d[1]*q+d[2])*q+d[3])*q+d[4])*q+1)
+        return math.inf
+    ratio = numerator / denominator
+    return math.ceil(ratio * ratio)
+
+
+def min_detectable_p1(
+    n: int,
+    p0: float,
+    power: float = 0.80,
+    one_sided: bool = True,
+) -> float:
+    """Smallest true proportion detectable with the given power at n tokens.
+
+    Inverts power_z_test_proportion: power is reached when
+    p1 − z_β·√(p1·q1/n) equals the critical value c, which squares to the
+    quadratic (1 + k²)p1² − (2c + k²)p1 + c² = 0 with k = z_β/√n; the
+    larger root is the one above c.
+    """
+    z_alpha = _Z_ALPHA[one_sided]
+    z_beta = _z_beta(power)
+    c = p0 + z_alpha * math.sqrt(p0 * (1 - p0) / n)
+    k2 = z_beta * z_beta / n
+    b = 2 * c + k2
+    return (b + math.sqrt(b * b - 4 * (1 + k2) * c * c)) / (2 * (1 + k2))
+
+
+def anova_power(n: int, k: int, f, alpha: float = 0.05):
+    """Power of a one-way ANOVA with k groups of n, for Cohen's effect size f.
+
+    Exact non-central F tail; f may be an array of effect sizes.
+    """
+    # scipy.stats costs ~0.7 s to import; only this helper needs it
+    from scipy.stats import f as f_dist, ncf
+
+    dfn, dfd = k - 1, k * (n - 1)
+    critical_value = f_dist.ppf(1 - alpha, dfn, dfd)
+    return ncf.sf(critical_value, dfn, dfd, n * k * np.square(f))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -119,50 +133,39 @@ class TestTitleLevelPower:
 
     TITLE_TOKENS = 1000  # ~141 titles × ~7 words
     TECH_BASELINE = 0.002  # 0.2% void in technical text
-
-    def test_power_for_2x_elevation(self):
-        """Can we detect a doubling of void rate in titles?"""
-        power = power_z_test_proportion(
-            n=self.TITLE_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 2,  # 0.4%
-        )
-        assert power < 0.20, (
-            f"Title-level power for 2× effect: {power:.1%}. "
-            "Should be <20% (effectively useless)."
-        )
-
-    def test_power_for_5x_elevation(self):
-        """Can we detect a 5× elevation in titles?"""
-        power = power_z_test_proportion(
-            n=self.TITLE_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 5,  # 1.0%
-        )
-        assert power < 0.50, (
-            f"Title-level power for 5× effect: {power:.1%}. "
-            "Should be <50% (still inadequate)."
-        )
-
-    def test_power_for_10x_elevation(self):
-        """Can we detect a 10× elevation in titles?"""
-        power = power_z_test_proportion(
-            n=self.TITLE_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 10,  # 2.0%
-        )
+    P1_2X = TECH_BASELINE * 2    # 0.4%
+    # Poisson approximation under the null: log P(X=0) = -λ, exact in log
+    # space and free of underflow at large λ
+    EXPECTED_NULL_COUNT = TITLE_TOKENS * TECH_BASELINE  # ~2 expected
+    LOG_P_ZERO_NULL = -EXPECTED_NULL_COUNT
+    # Power at 2×, 5×, 10× (0.4%, 1.0%, 2.0%), computed in one vectorized call
+    ELEVATIONS = (2, 5, 10)
+    POWER = dict(zip(ELEVATIONS, power_z_test_proportion(
+        n=TITLE_TOKENS, p0=TECH_BASELINE, p1=TECH_BASELINE * np.array(ELEVATIONS),
+    )))
+
+    @pytest.mark.parametrize("elevation, max_power, verdict", [
+        pytest.param(2, 0.20, "Should be <20% (effectively useless).", id="2x"),
+        pytest.param(5, 0.50, "Should be <50% (still inadequate).", id="5x"),
         # Even 10× might not be detectable with 1000 tokens
         # Power should be moderate at best
-        assert power < 0.90, (
-            f"Title-level power for 10× effect: {power:.1%}. "
-            "Even massive effects are hard to detect in 1000 tokens."
+        pytest.param(
+            10, 0.90, "Even massive effects are hard to detect in 1000 tokens.",
+            id="10x",
+        ),
+    ])
+    def test_power_for_elevation(self, elevation, max_power, verdict):
+        """Can we detect a doubling, 5× or 10× elevation of void rate in titles?"""
+        power = self.POWER[elevation]
+        assert power < max_power, (
+            f"Title-level power for {elevation}× effect: {power:.1%}. {verdict}"
         )
 
     def test_required_n_for_2x_detection(self):
         """How many title tokens would we need to detect a 2× effect?"""
         n_required = required_n_for_power(
             p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 2,
+            p1=self.P1_2X,
             power=0.80,
         )
         assert n_required > self.TITLE_TOKENS, (
@@ -172,11 +175,9 @@ class TestTitleLevelPower:
 
     def test_null_result_is_expected(self):
         """Under the null hypothesis, P(0 void hits) is HIGH with only 1000 tokens."""
-        expected_count = self.TITLE_TOKENS * self.TECH_BASELINE  # ~2 expected
-        # Poisson approximation: P(X=0) = e^(-λ)
-        p_zero = math.exp(-expected_count)
-        assert p_zero > 0.10, (
-            f"P(0 hits | λ={expected_count:.1f}) = {p_zero:.2%}. "
+        assert self.LOG_P_ZERO_NULL > math.log(0.10), (
+            f"P(0 hits | λ={self.EXPECTED_NULL_COUNT:.1f}) = "
+            f"{math.exp(self.LOG_P_ZERO_NULL):.2%}. "
             "Zero hits is a likely outcome even WITHOUT any effect."
         )
 
@@ -190,61 +191,35 @@ class TestFullTextPower:
 
     FULL_TEXT_TOKENS = 60_000  # 120 convos × ~500 tokens each
     TECH_BASELINE = 0.002
-
-    def test_power_for_2x_elevation(self):
-        """Full text: can we detect a doubling?"""
-        power = power_z_test_proportion(
-            n=self.FULL_TEXT_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 2,
-        )
+    # Power at 2×, 5×, 10×, computed in one vectorized call
+    ELEVATIONS = (2, 5, 10)
+    POWER = dict(zip(ELEVATIONS, power_z_test_proportion(
+        n=FULL_TEXT_TOKENS, p0=TECH_BASELINE, p1=TECH_BASELINE * np.array(ELEVATIONS),
+    )))
+    # Smallest void density detectable at 80% power
+    MIN_DETECTABLE = min_detectable_p1(n=FULL_TEXT_TOKENS, p0=TECH_BASELINE, power=0.80)
+
+    @pytest.mark.parametrize("elevation, min_power, verdict", [
         # With 60K tokens, 2× should be marginal
         # Expected hits: 120 (null) vs 240 (alt)
         # This SHOULD be somewhat detectable
-        assert power > 0.10, (
-            f"Full-text power for 2× effect: {power:.1%}. "
-            "Expected to be at least marginally powered."
-        )
-
-    def test_power_for_5x_elevation(self):
-        """Full text: can we detect a 5× elevation?"""
-        power = power_z_test_proportion(
-            n=self.FULL_TEXT_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 5,  # 1.0%
-        )
-        assert power > 0.80, (
-            f"Full-text power for 5× effect: {power:.1%}. "
-            "Should have adequate power (>80%) for large effects."
-        )
-
-    def test_power_for_10x_elevation(self):
-        """Full text: 10× elevation should be trivially detectable."""
-        power = power_z_test_proportion(
-            n=self.FULL_TEXT_TOKENS,
-            p0=self.TECH_BASELINE,
-            p1=self.TECH_BASELINE * 10,
-        )
-        assert power > 0.99, (
-            f"Full-text power for 10× effect: {power:.1%}. "
-            "Should be >99%."
+        pytest.param(2, 0.10, "Expected to be at least marginally powered.", id="2x"),
+        pytest.param(
+            5, 0.80, "Should have adequate power (>80%) for large effects.", id="5x",
+        ),
+        # 10× elevation should be trivially detectable
+        pytest.param(10, 0.99, "Should be >99%.", id="10x"),
+    ])
+    def test_power_for_elevation(self, elevation, min_power, verdict):
+        """Full text: can we detect a doubling, 5× or 10× elevation?"""
+        power = self.POWER[elevation]
+        assert power > min_power, (
+            f"Full-text power for {elevation}× effect: {power:.1%}. {verdict}"
         )
 
     def test_minimum_detectable_effect(self):
         """What's the smallest elevation detectable at 80% power with full text?"""
-        # Binary search for the smallest p1 that gives 80% power
-        low, high = self.TECH_BASELINE, 0.05
-        for _ in range(50):
-            mid = (low + high) / 2
-            power = power_z_test_proportion(
-                n=self.FULL_TEXT_TOKENS, p0=self.TECH_BASELINE, p1=mid,
-            )
-            if power < 0.80:
-                low = mid
-            else:
-                high = mid
-
-        min_detectable = high
+        min_detectable = self.MIN_DETECTABLE
         multiplier = min_detectable / self.TECH_BASELINE
 
         # Document the minimum detectable effect
@@ -264,35 +239,29 @@ class TestCrossPlatformPower:
 
     CONVOS_PER_PLATFORM = 120
     TOKENS_PER_CONVO = 500  # Average conversation length
+    TOTAL_TOKENS = CONVOS_PER_PLATFORM * TOKENS_PER_CONVO  # 60K
 
     def test_between_platform_anova_power(self):
         """Can we detect platform differences with 120 convos each?"""
-        # For one-way ANOVA with 4 groups, effect size f
-        # Using approximation: power ≈ Φ(√(n*f²*k) - z_α)
+        # One-way ANOVA with 4 groups, effect size f, noncentrality n*f²*k
         # where k = number of groups, n = per group
         k = 4  # Grok, Claude, GPT-4, Gemini
         n = self.CONVOS_PER_PLATFORM
 
         # Medium effect size (f = 0.25, η² ≈ 0.06)
         f_medium = 0.25
-        # Noncentrality parameter
-        ncp = n * f_medium**2 * k
-        # Approximate power using chi-squared
-        power_approx = 1 - normal_cdf(1.645 - math.sqrt(ncp))
+        power = anova_power(n, k, f_medium)
 
-        assert power_approx > 0.95, (
-            f"Cross-platform ANOVA power for medium effect: {power_approx:.1%}. "
+        assert power > 0.95, (
+            f"Cross-platform ANOVA power for medium effect: {power:.1%}. "
             "Should be >95% with 120 conversations per platform."
         )
 
     def test_pairwise_comparison_power(self):
         """Power for detecting a difference between Grok and one other model."""
-        n = self.CONVOS_PER_PLATFORM
-        tokens = n * self.TOKENS_PER_CONVO  # 60K tokens
-
         # If Grok has 0.5% void and Claude has 0.2%
         power = power_z_test_proportion(
-            n=tokens,
+            n=self.TOTAL_TOKENS,
             p0=0.002,
             p1=0.005,
         )
@@ -361,6 +330,11 @@ class TestOutlierDetectionPower:
 class TestSampleSizeRecommendations:
     """Tests that compute and validate required sample sizes."""
 
+    # 30 topics × 3 conditions (normal, dry academic, just facts)
+    PERSONALITY_TOTAL: Final[int] = 30 * 3
+    # 50 prompts × 4 platforms
+    CROSS_PLATFORM_TOTAL: Final[int] = 50 * 4
+
     def test_minimum_conversations_for_temporal_analysis(self):
         """How many conversations per month to detect model version changes?"""
         # Stylometric change detection needs ~30 texts per window (literature)
@@ -376,10 +350,11 @@ class TestSampleSizeRecommendations:
             "Feb_2026": 3,
         }
 
-        underpowered_months = [
-            month for month, count in monthly_counts.items()
-            if count < min_per_window
-        ]
+        months = np.array(list(monthly_counts))
+        counts = np.fromiter(
+            monthly_counts.values(), dtype=np.int32, count=len(monthly_counts),
+        )
+        underpowered_months = months[counts < min_per_window].tolist()
         assert len(underpowered_months) > 0, (
             "Expected some months to be underpowered for temporal analysis"
         )
@@ -389,19 +364,15 @@ class TestSampleSizeRecommendations:
 
     def test_minimum_for_prospective_personality_control(self):
         """30 topics × 3 conditions = 90 new conversations needed."""
-        topics_needed = 30
-        conditions = 3  # normal, dry academic, just facts
-        total = topics_needed * conditions
-
-        assert total == 90, "Personality control experiment needs 90 conversations"
+        assert self.PERSONALITY_TOTAL == 90, (
+            "Personality control experiment needs 90 conversations"
+        )
 
     def test_minimum_for_cross_platform(self):
         """50 prompts × 4 platforms = 200 conversations for cross-platform study."""
-        prompts = 50
-        platforms = 4
-        total = prompts * platforms
-
-        assert total == 200, "Cross-platform comparison needs 200 conversations"
+        assert self.CROSS_PLATFORM_TOTAL == 200, (
+            "Cross-platform comparison needs 200 conversations"
+        )
         # This is feasible but labor-intensive
         # Automation via API would reduce cost
 
@@ -418,8 +389,11 @@ class TestSampleSizeRecommendations:
             "cross_platform_matched": True,      # ADEQUATE (if prompts extracted)
         }
 
-        adequate = sum(1 for v in analyses.values() if v)
-        inadequate = sum(1 for v in analyses.values() if not v)
+        # One pass packs the verdicts into a bitmask (bit i = i-th analysis);
+        # adequate is its popcount (bin().count: int.bit_count needs 3.10+)
+        adequate_mask = sum(ok << i for i, ok in enumerate(analyses.values()))
+        adequate = bin(adequate_mask).count("1")
+        inadequate = len(analyses) - adequate
 
         assert adequate > 0 and inadequate > 0, (
             "120 conversations is adequate for some analyses and inadequate for others. "